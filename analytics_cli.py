@@ -4,23 +4,41 @@
 import argparse
 import sys
 from datetime import datetime
+from functools import lru_cache
 
-from analytics_framework.main import main as analytics_main
 
+# Supported date formats, tried in this order
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+DATETIME_ISO_Z_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+DATETIME_SPACE_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATE_FORMATS = (DATE_FORMAT, DATETIME_ISO_FORMAT, DATETIME_ISO_Z_FORMAT, DATETIME_SPACE_FORMAT)
 
+
+@lru_cache(maxsize=128)
 def parse_date(date_str):
     """Parse date string in various formats."""
     if not date_str:
         return None
-        
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d %H:%M:%S"
-    ]
     
-    for fmt in formats:
+    # Fast path: guess the format from the length of zero-padded input
+    n = len(date_str)
+    fmt = None
+    if n == 10:
+        fmt = DATE_FORMAT
+    elif n == 19:
+        fmt = DATETIME_ISO_FORMAT if date_str[10] == 'T' else DATETIME_SPACE_FORMAT
+    elif n == 20 and date_str.endswith('Z'):
+        fmt = DATETIME_ISO_Z_FORMAT
+    
+    if fmt is not None:
+        try:
+            return datetime.strptime(date_str, fmt).isoformat()
+        except ValueError:
+            pass
+    
+    # Anything else (such as unpadded 2024-1-5) tries every format in order
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt).isoformat()
         except ValueError:
@@ -29,14 +47,20 @@ def parse_date(date_str):
     raise ValueError(f"Unsupported date format: {date_str}")
 
 
-def main():
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(description='Conversation Analytics Framework')
-    
-    # Create subparsers for different commands
-    subparsers = parser.add_subparsers(dest='command', help='Command to run')
-    
-    # Collect command
+COMMANDS = ('collect', 'status')
+
+
+def _sniff_subcommand(argv):
+    """Return the first known subcommand in argv, or None."""
+    for arg in argv:
+        if arg.startswith('-'):
+            continue
+        return arg if arg in COMMANDS else None
+    return None
+
+
+def _build_collect_parser(subparsers):
+    """Add the collect subcommand parser."""
     collect_parser = subparsers.add_parser('collect', help='Collect and process conversation data')
     collect_parser.add_argument('--start-date', type=str, help='Start date for data collection (YYYY-MM-DD)')
     collect_parser.add_argument('--end-date', type=str, help='End date for data collection (YYYY-MM-DD)')
@@ -47,10 +71,35 @@ def main():
     collect_parser.add_argument('--resume', action='store_true', help='Resume from last processed conversation')
     collect_parser.add_argument('--state-file', type=str, default='processing_state.json', help='Path to state file')
     collect_parser.add_argument('--use-s3-state', action='store_true', help='Use S3 for state tracking')
-    
-    # Status command
+    return collect_parser
+
+
+def _build_status_parser(subparsers):
+    """Add the status subcommand parser."""
     status_parser = subparsers.add_parser('status', help='Show processing status')
     status_parser.add_argument('--state-file', type=str, default='processing_state.json', help='Path to state file')
+    return status_parser
+
+
+def main():
+    """Main entry point for the CLI."""
+    parser = argparse.ArgumentParser(description='Conversation Analytics Framework')
+    
+    # Create subparsers for different commands
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+    
+    # Only build the parser for the requested command; build all of them
+    # when no command is given so --help still lists everything
+    builders = {
+        'collect': _build_collect_parser,
+        'status': _build_status_parser
+    }
+    command = _sniff_subcommand(sys.argv[1:])
+    if command:
+        builders[command](subparsers)
+    else:
+        for build in builders.values():
+            build(subparsers)
     
     # Parse arguments
     args = parser.parse_args()
@@ -91,6 +140,9 @@ def main():
         if args.use_s3_state:
             sys.argv.append('--use-s3-state')
         
+        # Import here so other commands don't pay for loading the analytics stack
+        from analytics_framework.main import main as analytics_main
+        
         # Run the main function
         analytics_main()
         
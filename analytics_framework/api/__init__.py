@@ -1,9 +1,11 @@
 """API clients for the analytics framework."""
 
-from .nocodb_client import NocoDBClient
+from .nocodb_client import NocoDBClient, BulkCreateBatcher, BulkMutationBatcher
 from .dify_client import DifyClient
 
 __all__ = [
     'NocoDBClient',
+    'BulkCreateBatcher',
+    'BulkMutationBatcher',
     'DifyClient'
 ]
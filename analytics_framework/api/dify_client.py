@@ -1,11 +1,13 @@
 """Client for interacting with the Dify Workflow API."""
 
-import json
 import logging
-import time
+import os
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Generator, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import RequestException
 
 from ..config import (
@@ -14,6 +16,41 @@ from ..config import (
     MAX_RETRIES,
     RETRY_DELAY
 )
+from ..utils import json_utils
+from ..utils.http_client import RETRY_STATUS_CODES
+
+
+# Common MIME types, keyed by lowercase file extension
+_MIME_TYPES = MappingProxyType({
+    # Documents
+    'txt': 'text/plain',
+    'md': 'text/markdown',
+    'pdf': 'application/pdf',
+    'html': 'text/html',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'xls': 'application/vnd.ms-excel',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'csv': 'text/csv',
+    
+    # Images
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+    'svg': 'image/svg+xml',
+    
+    # Audio
+    'mp3': 'audio/mpeg',
+    'm4a': 'audio/m4a',
+    'wav': 'audio/wav',
+    'webm': 'audio/webm',
+    
+    # Video
+    'mp4': 'video/mp4',
+    'mov': 'video/quicktime',
+    'mpeg': 'video/mpeg',
+})
 
 
 class DifyClient:
@@ -38,6 +75,21 @@ class DifyClient:
             "Content-Type": "application/json"
         }
         self.logger = logging.getLogger(__name__)
+        
+        # Reuse connections across calls; transient failures and 429s are
+        # retried with exponential backoff (honoring Retry-After) by urllib3
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        retry_strategy = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_DELAY,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry_strategy)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
     
     def execute_workflow(
         self,
@@ -87,19 +139,16 @@ class DifyClient:
         Returns:
             API response
         """
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.post(url, headers=self.headers, json=data)
-                response.raise_for_status()
-                result = response.json()
-                self.logger.info(f"Workflow execution successful: {result.get('workflow_run_id')}")
-                return result
-            except RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt+1}/{MAX_RETRIES}): {str(e)}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (2 ** attempt))  # Exponential backoff
-                else:
-                    raise
+        try:
+            response = self._session.post(url, json=data)
+            response.raise_for_status()
+        except RequestException as e:
+            self.logger.error(f"Workflow execution failed: {str(e)}")
+            raise
+        
+        result = json_utils.loads(response.content)
+        self.logger.info(f"Workflow execution successful: {result.get('workflow_run_id')}")
+        return result
     
     def _execute_streaming(self, url: str, data: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
         """
@@ -113,15 +162,23 @@ class DifyClient:
             Generator yielding streaming responses
         """
         try:
-            response = requests.post(url, headers=self.headers, json=data, stream=True)
+            response = self._session.post(url, json=data, stream=True)
             response.raise_for_status()
             
-            for line in response.iter_lines():
-                if line:
-                    line = line.decode('utf-8')
-                    if line.startswith('data:'):
-                        data = json.loads(line[5:])
-                        yield data
+            # Work on raw bytes: the JSON parser accepts bytes, so no per-line decode
+            for line in response.iter_lines(decode_unicode=False):
+                if not line or not line.startswith(b'data:'):
+                    continue
+                
+                payload = line[5:].lstrip()
+                if payload == b'[DONE]':
+                    return
+                
+                try:
+                    yield json_utils.loads(payload)
+                except ValueError:
+                    self.logger.debug(f"Skipping malformed SSE payload: {payload[:100]!r}")
+                    continue
         except RequestException as e:
             self.logger.error(f"Streaming request failed: {str(e)}")
             raise
@@ -139,31 +196,26 @@ class DifyClient:
         """
         url = f"{self.base_url}/files/upload"
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-            # Don't set Content-Type here, let requests set it for multipart/form-data
-        }
+        # Drop the session's JSON Content-Type so requests sets multipart/form-data
+        headers = {"Content-Type": None}
         
         with open(file_path, 'rb') as file:
             files = {
-                'file': (file_path.split('/')[-1], file, self._get_mime_type(file_path)),
+                'file': (os.path.basename(file_path), file, self._get_mime_type(file_path)),
             }
             
             data = {'type': file_type}
             
-            for attempt in range(MAX_RETRIES):
-                try:
-                    response = requests.post(url, headers=headers, data=data, files=files)
-                    response.raise_for_status()
-                    result = response.json()
-                    self.logger.info(f"File upload successful: {result.get('id')}")
-                    return result
-                except RequestException as e:
-                    self.logger.warning(f"Upload failed (attempt {attempt+1}/{MAX_RETRIES}): {str(e)}")
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY * (2 ** attempt))
-                    else:
-                        raise
+            try:
+                response = self._session.post(url, headers=headers, data=data, files=files)
+                response.raise_for_status()
+            except RequestException as e:
+                self.logger.error(f"File upload failed: {str(e)}")
+                raise
+        
+        result = json_utils.loads(response.content)
+        self.logger.info(f"File upload successful: {result.get('id')}")
+        return result
     
     def get_workflow_result(self, workflow_run_id: str) -> Dict[str, Any]:
         """
@@ -177,17 +229,14 @@ class DifyClient:
         """
         url = f"{self.base_url}/workflows/runs/{workflow_run_id}"
         
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, headers=self.headers)
-                response.raise_for_status()
-                return response.json()
-            except RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt+1}/{MAX_RETRIES}): {str(e)}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (2 ** attempt))
-                else:
-                    raise
+        try:
+            response = self._session.get(url)
+            response.raise_for_status()
+        except RequestException as e:
+            self.logger.error(f"Fetching workflow result failed: {str(e)}")
+            raise
+        
+        return json_utils.loads(response.content)
     
     def _get_mime_type(self, file_path: str) -> str:
         """
@@ -199,38 +248,17 @@ class DifyClient:
         Returns:
             MIME type string
         """
-        ext = file_path.lower().split('.')[-1]
-        
-        # Common MIME types
-        mime_types = {
-            # Documents
-            'txt': 'text/plain',
-            'md': 'text/markdown',
-            'pdf': 'application/pdf',
-            'html': 'text/html',
-            'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            'xls': 'application/vnd.ms-excel',
-            'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'csv': 'text/csv',
-            
-            # Images
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'gif': 'image/gif',
-            'webp': 'image/webp',
-            'svg': 'image/svg+xml',
-            
-            # Audio
-            'mp3': 'audio/mpeg',
-            'm4a': 'audio/m4a',
-            'wav': 'audio/wav',
-            'webm': 'audio/webm',
-            
-            # Video
-            'mp4': 'video/mp4',
-            'mov': 'video/quicktime',
-            'mpeg': 'video/mpeg',
-        }
-        
-        return mime_types.get(ext, 'application/octet-stream')
\ No newline at end of file
+        ext = file_path.rpartition('.')[2].lower()
+        return _MIME_TYPES.get(ext, 'application/octet-stream')
+    
+    def close(self):
+        """Close the HTTP session."""
+        self._session.close()
+    
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context manager."""
+        self.close()
\ No newline at end of file
@@ -1,23 +1,72 @@
 """Client for interacting with the NocoDB API."""
 
 import logging
-from typing import Dict, List, Optional, Any, Callable
+import math
+import queue
+import threading
+from typing import Dict, List, Optional, Any, Callable, Iterator
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, groupby
+from operator import itemgetter
+
+import requests
 
 from ..config import (
     NOCODB_BASE_URL,
     NOCODB_API_TOKEN,
     NOCODB_PROJECT_ID,
+    NOCODB_CACHE_ENABLED,
+    NOCODB_CACHE_TTL,
+    NOCODB_CACHE_MAXSIZE,
+    NOCODB_RATE_LIMIT,
     MAX_RETRIES,
     RETRY_DELAY,
     IO_THREADS
 )
+from ..utils import json_utils
 from ..utils.http_client import APIClient
+from ..utils.rate_limiter import RateLimiter
+from ..utils.thread_pool import thread_pool_manager
+from ..utils.ttl_cache import TTLCache
+
+# Back off when the API reports fewer remaining requests than this
+RATE_LIMIT_MIN_REMAINING = 5
+DEFAULT_RATE_LIMIT_DELAY = 0.1
+
+# Header sent with request bodies serialized by json_utils.dumps
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Largest page size NocoDB accepts
+MAX_PAGE_SIZE = 1000
+
+# WHERE clause templates
+_WHERE_ID_IN = "(id,in,{})"
+_WHERE_CONV_ID_IN = "(conversation_id,in,{})"
+
+# Defaults for bulk requests and for coalescing single mutations into them
+BULK_BATCH_SIZE = 100
+BULK_MAX_WAIT_MS = 50
 
 
 class NocoDBClient:
     """Client for interacting with NocoDB API."""
     
+    __slots__ = (
+        "base_url",
+        "project_id",
+        "max_workers",
+        "api_client",
+        "_table_endpoints",
+        "_cache",
+        "_rate_limiter",
+        "_page_executor"
+    )
+    
+    logger = logging.getLogger(__name__)
+    
     def __init__(
         self,
         base_url: str = NOCODB_BASE_URL,
@@ -25,7 +74,11 @@ class NocoDBClient:
         project_id: str = NOCODB_PROJECT_ID,
         max_retries: int = MAX_RETRIES,
         retry_delay: int = RETRY_DELAY,
-        max_workers: int = IO_THREADS
+        max_workers: int = IO_THREADS,
+        cache_enabled: bool = NOCODB_CACHE_ENABLED,
+        cache_ttl: int = NOCODB_CACHE_TTL,
+        cache_maxsize: int = NOCODB_CACHE_MAXSIZE,
+        rate_limit: float = NOCODB_RATE_LIMIT
     ):
         """
         Initialize the NocoDB client.
@@ -37,10 +90,30 @@ class NocoDBClient:
             max_retries: Maximum number of retries for failed requests
             retry_delay: Delay between retries in seconds
             max_workers: Maximum number of worker threads for parallel requests
+            cache_enabled: Whether to cache fetched pages in memory
+            cache_ttl: Time-to-live of cached pages in seconds
+            cache_maxsize: Maximum number of cached pages
+            rate_limit: Maximum requests per second, or 0 for no client-side limit
         """
         self.base_url = base_url
         self.project_id = project_id
-        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+        
+        # Table endpoints keyed on (table_name, bulk), built on first use
+        self._table_endpoints = {}
+        
+        # Raw bodies of complete pages keyed on (table, where, sort, limit, page, fields)
+        self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl) if cache_enabled else None
+        
+        # Optional client-side quota; 429s are otherwise handled reactively
+        self._rate_limiter = RateLimiter(rate_limit, burst=max_workers) if rate_limit > 0 else None
+        
+        # Page fetches for iter_pages; owned by the client rather than the
+        # shared IO pool, whose tasks may themselves iterate pages and wait
+        self._page_executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="nocodb-pages"
+        )
         
         # Initialize API client
         self.api_client = APIClient(
@@ -53,29 +126,143 @@ class NocoDBClient:
             max_workers=max_workers
         )
     
-    def _get_endpoint(self, table_name: str, record_id: Optional[str] = None) -> str:
+    def _get_endpoint(
+        self,
+        table_name: str,
+        record_id: Optional[str] = None,
+        bulk: bool = False
+    ) -> str:
         """
         Build the API endpoint for a table or record.
         
         Args:
             table_name: Name of the table
             record_id: Optional ID of a specific record
+            bulk: Whether to build the bulk endpoint for the table
             
         Returns:
             API endpoint
         """
-        endpoint = f"/api/v1/db/data/v2/noco/{self.project_id}/{table_name}"
+        key = (table_name, bulk)
+        endpoint = self._table_endpoints.get(key)
+        if endpoint is None:
+            data_path = "bulk/v2" if bulk else "v2"
+            endpoint = f"/api/v1/db/data/{data_path}/noco/{self.project_id}/{table_name}"
+            self._table_endpoints[key] = endpoint
+        
         if record_id:
-            endpoint = f"{endpoint}/{record_id}"
+            return endpoint + "/" + str(record_id)
         return endpoint
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _eq(field: str, value: Any) -> str:
+        """
+        Build (and cache) an equality WHERE clause.
+        
+        Args:
+            field: Column name
+            value: Value to compare against
+            
+        Returns:
+            WHERE clause such as "(id,eq,42)"
+        """
+        return f"({field},eq,{value})"
+    
+    def _respect_rate_limit(self, response: requests.Response) -> None:
+        """
+        Sleep only when the API reports that the rate limit is nearly exhausted.
+        
+        Responses with status 429 are retried with exponential backoff by the
+        underlying HTTP client session, so this only handles the soft limit.
+        
+        Args:
+            response: Response whose rate limit headers should be inspected
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        
+        try:
+            if int(remaining) >= RATE_LIMIT_MIN_REMAINING:
+                return
+            delay = float(response.headers.get("Retry-After", DEFAULT_RATE_LIMIT_DELAY))
+        except ValueError:
+            delay = DEFAULT_RATE_LIMIT_DELAY
+        
+        self.logger.debug(f"Rate limit nearly exhausted ({remaining} remaining), sleeping {delay}s")
+        time.sleep(delay)
+    
+    def _request(
+        self,
+        method: str,
+        table_name: str,
+        record_id: Optional[str] = None,
+        bulk: bool = False,
+        **kwargs
+    ) -> Any:
+        """
+        Make a request against a table or record and decode the JSON body.
+        
+        Args:
+            method: HTTP method
+            table_name: Name of the table
+            record_id: Optional ID of a specific record
+            bulk: Whether to use the table's bulk endpoint
+            **kwargs: Additional arguments for the HTTP client (params, json, ...)
+            
+        Returns:
+            Decoded response body
+        """
+        return json_utils.loads(
+            self._request_content(method, table_name, record_id, bulk=bulk, **kwargs)
+        )
+    
+    def _request_content(
+        self,
+        method: str,
+        table_name: str,
+        record_id: Optional[str] = None,
+        bulk: bool = False,
+        **kwargs
+    ) -> bytes:
+        """
+        Make a request against a table or record and return the raw JSON body.
+        
+        Retries and backoff are handled by the HTTP client's session adapter.
+        
+        Args:
+            method: HTTP method
+            table_name: Name of the table
+            record_id: Optional ID of a specific record
+            bulk: Whether to use the table's bulk endpoint
+            **kwargs: Additional arguments for the HTTP client (params, json, ...)
+            
+        Returns:
+            Undecoded response body
+        """
+        endpoint = self._get_endpoint(table_name, record_id, bulk=bulk)
+        
+        # Serialize bodies ourselves instead of letting requests use stdlib json
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["data"] = json_utils.dumps(body)
+            kwargs["headers"] = _JSON_HEADERS
+        
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        response = self.api_client.http_client.request(method, endpoint, **kwargs)
+        self._respect_rate_limit(response)
+        return response.content
+    
     def fetch_records(
         self,
         table_name: str,
         where: Optional[str] = None,
         sort: Optional[str] = None,
-        limit: int = 1000,
-        page: int = 1
+        limit: int = MAX_PAGE_SIZE,
+        page: int = 1,
+        fields: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Fetch records from a table with pagination.
@@ -86,11 +273,11 @@ class NocoDBClient:
             sort: Sorting criteria
             limit: Number of records per page (max 1000)
             page: Page number
+            fields: Comma-separated columns to return (all columns if None)
             
         Returns:
             API response with records and pagination info
         """
-        endpoint = self._get_endpoint(table_name)
         params = {"limit": limit, "page": page}
         
         if where:
@@ -99,71 +286,209 @@ class NocoDBClient:
         if sort:
             params["sort"] = sort
         
-        self.logger.debug(f"Fetching {table_name} with params: {params}")
+        if fields:
+            params["fields"] = fields
+        
+        # Pages are cached as raw bodies and decoded on every hit, so callers
+        # always get their own copy and may mutate it freely
+        cache_key = (table_name, where, sort, limit, page, fields)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return json_utils.loads(cached)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Fetching {table_name} with params: {params}")
         
-        response = self.api_client.http_client.get(endpoint, params=params)
-        return response.json()
+        content = self._request_content("GET", table_name, params=params)
+        response = json_utils.loads(content)
+        
+        # Only cache complete pages. Callers page in id order, so the last,
+        # partial page is the one that grows as new rows arrive.
+        if self._cache is not None and self._is_complete_page(response, limit):
+            self._cache.set(cache_key, content)
+        
+        return response
     
-    def fetch_all_records(
+    @staticmethod
+    def _is_complete_page(response: Any, limit: int) -> bool:
+        """
+        Check whether a page is full and followed by more pages.
+        
+        Args:
+            response: Decoded fetch_records response
+            limit: Requested page size
+            
+        Returns:
+            True if the page holds limit records and reports a next page
+        """
+        if not isinstance(response, dict):
+            return False
+        
+        records = response.get("list")
+        page_info = response.get("pageInfo") or {}
+        return (
+            isinstance(records, list)
+            and len(records) == limit
+            and bool(page_info.get("hasNextPage", False))
+        )
+    
+    def _invalidate_cache(self, table_name: str) -> None:
+        """
+        Drop cached pages of a table after it was modified.
+        
+        Args:
+            table_name: Name of the modified table
+        """
+        if self._cache is not None:
+            self._cache.invalidate(lambda key: key[0] == table_name)
+    
+    def iter_pages(
         self,
         table_name: str,
         where: Optional[str] = None,
         sort: Optional[str] = None,
-        batch_callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None
-    ) -> List[Dict[str, Any]]:
+        prefetch: int = 2,
+        fields: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Fetch all records from a table with automatic pagination.
+        Iterate over a table one page of records at a time.
+        
+        The first page is fetched on its own, so single-page results cost one
+        request. After that up to ``prefetch`` pages are fetched in the
+        background while the caller processes the current one. Once the first
+        page reports totalRows and
+        pageSize, the remaining pages are fetched with up to ``max_workers``
+        requests in flight. Pages are always yielded in order.
         
         Args:
             table_name: Name of the table
             where: WHERE clause for filtering
             sort: Sorting criteria
-            batch_callback: Optional callback function to process each batch
+            prefetch: Number of pages to fetch ahead before the page count is known
+            fields: Comma-separated columns to return (all columns if None)
             
-        Returns:
-            List of all records
+        Yields:
+            Lists of records, one per page
         """
-        all_records = []
-        page = 1
-        has_more = True
+        window = 1
+        next_page = 1
+        last_page = None
+        pending = deque()
         
-        while has_more:
-            self.logger.info(f"Fetching page {page} from {table_name}")
-            
-            try:
-                response = self.fetch_records(
+        # Pages are fetched on the client's page executor; rate limiting (429)
+        # is handled by the HTTP client
+        def fill_window() -> None:
+            nonlocal next_page
+            while len(pending) < window and (last_page is None or next_page <= last_page):
+                self.logger.debug(f"Fetching page {next_page} from {table_name}")
+                pending.append(self._page_executor.submit(
+                    self.fetch_records,
                     table_name=table_name,
                     where=where,
                     sort=sort,
-                    page=page
-                )
+                    page=next_page,
+                    fields=fields
+                ))
+                next_page += 1
+        
+        try:
+            fill_window()
+            while pending:
+                response = pending.popleft().result()
                 
-                if not response.get("list") or not isinstance(response["list"], list):
+                try:
+                    records = response["list"]
+                    page_info = response.get("pageInfo") or {}
+                except (KeyError, TypeError, AttributeError):
                     self.logger.warning(f"Unexpected API response format: {response}")
-                    break
+                    return
                 
-                records = response["list"]
+                if not records:
+                    return
                 
-                # Process batch if callback provided
-                if batch_callback and callable(batch_callback):
-                    batch_callback(records)
-                else:
-                    all_records.extend(records)
+                if not page_info.get("hasNextPage", False):
+                    yield records
+                    return
                 
-                # Check if there are more pages
-                page_info = response.get("pageInfo", {})
-                has_more = page_info.get("hasNextPage", False)
-                page += 1
+                window = max(window, prefetch)
                 
-                # Add a small delay to avoid rate limiting
-                if has_more:
-                    time.sleep(0.1)
-                    
-            except Exception as e:
-                self.logger.error(f"Error fetching records: {str(e)}")
-                raise
+                # With the total known, fetch the remaining pages concurrently
+                if last_page is None and page_info.get("totalRows") and page_info.get("pageSize"):
+                    last_page = math.ceil(page_info["totalRows"] / page_info["pageSize"])
+                    window = max(window, self.max_workers)
+                
+                # Request the following pages before handing this one out
+                fill_window()
+                yield records
+                
+        except Exception as e:
+            self.logger.error(f"Error fetching records: {str(e)}")
+            raise
         
-        self.logger.info(f"Retrieved {len(all_records) if not batch_callback else 'all'} records from {table_name}")
+        finally:
+            # Drop requests for pages that will not be consumed
+            for future in pending:
+                future.cancel()
+    
+    def iter_records(
+        self,
+        table_name: str,
+        where: Optional[str] = None,
+        sort: Optional[str] = None,
+        prefetch: int = 2,
+        fields: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all records of a table with automatic pagination.
+        
+        Args:
+            table_name: Name of the table
+            where: WHERE clause for filtering
+            sort: Sorting criteria
+            prefetch: Number of pages to fetch ahead of the consumer
+            fields: Comma-separated columns to return (all columns if None)
+            
+        Yields:
+            Records, one at a time
+        """
+        return chain.from_iterable(
+            self.iter_pages(table_name, where=where, sort=sort, prefetch=prefetch, fields=fields)
+        )
+    
+    def fetch_all_records(
+        self,
+        table_name: str,
+        where: Optional[str] = None,
+        sort: Optional[str] = None,
+        batch_callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all records from a table with automatic pagination.
+        
+        Prefer iter_records or iter_pages for large tables; this materializes
+        the whole table unless batch_callback is given.
+        
+        Args:
+            table_name: Name of the table
+            where: WHERE clause for filtering
+            sort: Sorting criteria
+            batch_callback: Optional callback function to process each batch
+                (deprecated, iterate over iter_pages instead)
+            fields: Comma-separated columns to return (all columns if None)
+            
+        Returns:
+            List of all records (empty when batch_callback is given)
+        """
+        if batch_callback and callable(batch_callback):
+            for records in self.iter_pages(table_name, where=where, sort=sort, fields=fields):
+                batch_callback(records)
+            self.logger.info(f"Retrieved all records from {table_name}")
+            return []
+        
+        all_records = list(self.iter_records(table_name, where=where, sort=sort, fields=fields))
+        self.logger.info(f"Retrieved {len(all_records)} records from {table_name}")
         return all_records
     
     def create_record(self, table_name: str, record: Dict[str, Any]) -> Dict[str, Any]:
@@ -177,12 +502,87 @@ class NocoDBClient:
         Returns:
             Created record
         """
-        endpoint = self._get_endpoint(table_name)
-        
         self.logger.debug(f"Creating record in {table_name}")
         
-        response = self.api_client.http_client.post(endpoint, json=record)
-        return response.json()
+        self._invalidate_cache(table_name)
+        return self._request("POST", table_name, json=record)
+    
+    def _bulk_request(
+        self,
+        method: str,
+        table_name: str,
+        records: List[Dict[str, Any]],
+        batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Send records to a table's bulk endpoint in chunks.
+        
+        Args:
+            method: HTTP method (POST to create, PATCH to update)
+            table_name: Name of the table
+            records: Records to send
+            batch_size: Maximum number of records per request
+            
+        Returns:
+            Concatenated responses, in the same order as records
+        """
+        results = []
+        for start in range(0, len(records), batch_size):
+            chunk = records[start:start + batch_size]
+            response = self._request(method, table_name, bulk=True, json=chunk)
+            if isinstance(response, list):
+                results.extend(response)
+        
+        self._invalidate_cache(table_name)
+        return results
+    
+    def create_records(
+        self,
+        table_name: str,
+        records: List[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several records in a table using bulk requests.
+        
+        Args:
+            table_name: Name of the table
+            records: Records to create
+            batch_size: Maximum number of records per request
+            
+        Returns:
+            Created records (typically their IDs), in the same order as records
+        """
+        if not records:
+            return []
+        
+        self.logger.debug(f"Creating {len(records)} records in {table_name}")
+        
+        return self._bulk_request("POST", table_name, records, batch_size)
+    
+    def update_records(
+        self,
+        table_name: str,
+        updates: List[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Update several records in a table using bulk requests.
+        
+        Args:
+            table_name: Name of the table
+            updates: Records to update, each containing its id and the fields to change
+            batch_size: Maximum number of records per request
+            
+        Returns:
+            Updated records (typically their IDs), in the same order as updates
+        """
+        if not updates:
+            return []
+        
+        self.logger.debug(f"Updating {len(updates)} records in {table_name}")
+        
+        return self._bulk_request("PATCH", table_name, updates, batch_size)
     
     def update_record(
         self,
@@ -201,12 +601,10 @@ class NocoDBClient:
         Returns:
             Updated record
         """
-        endpoint = self._get_endpoint(table_name, record_id)
-        
         self.logger.debug(f"Updating record {record_id} in {table_name}")
         
-        response = self.api_client.http_client.patch(endpoint, json=updates)
-        return response.json()
+        self._invalidate_cache(table_name)
+        return self._request("PATCH", table_name, record_id, json=updates)
     
     def delete_record(self, table_name: str, record_id: str) -> Dict[str, Any]:
         """
@@ -219,12 +617,10 @@ class NocoDBClient:
         Returns:
             Deletion response
         """
-        endpoint = self._get_endpoint(table_name, record_id)
-        
         self.logger.debug(f"Deleting record {record_id} from {table_name}")
         
-        response = self.api_client.http_client.delete(endpoint)
-        return response.json()
+        self._invalidate_cache(table_name)
+        return self._request("DELETE", table_name, record_id)
     
     def get_conversation_with_messages(self, conversation_id: str) -> Dict[str, Any]:
         """
@@ -243,8 +639,8 @@ class NocoDBClient:
         ]
         
         params_list = [
-            {"where": f"(id,eq,{conversation_id})"},
-            {"where": f"(conversation_id,eq,{conversation_id})", "sort": "created_at"}
+            {"where": self._eq("id", conversation_id), "limit": 1},
+            {"where": self._eq("conversation_id", conversation_id), "sort": "created_at", "limit": MAX_PAGE_SIZE}
         ]
         
         responses = self.api_client.http_client.parallel_get(endpoints, params_list)
@@ -252,7 +648,7 @@ class NocoDBClient:
         # Process conversation response
         conversation = None
         if not isinstance(responses[0], Exception):
-            conversation_response = responses[0].json()
+            conversation_response = json_utils.loads(responses[0].content)
             if conversation_response.get("list") and len(conversation_response["list"]) > 0:
                 conversation = conversation_response["list"][0]
         
@@ -263,41 +659,89 @@ class NocoDBClient:
         # Process messages response
         messages = []
         if not isinstance(responses[1], Exception):
-            messages_response = responses[1].json()
+            messages_response = json_utils.loads(responses[1].content)
             if messages_response.get("list") and isinstance(messages_response["list"], list):
                 messages = messages_response["list"]
                 
                 # If there are more pages, fetch them
                 page_info = messages_response.get("pageInfo", {})
-                has_more = page_info.get("hasNextPage", False)
-                
-                if has_more:
-                    # Fall back to sequential fetching for remaining pages
-                    page = 2
-                    while has_more:
-                        response = self.fetch_records(
-                            table_name="Messages",
-                            where=f"(conversation_id,eq,{conversation_id})",
-                            sort="created_at",
-                            page=page
-                        )
-                        
-                        if response.get("list") and isinstance(response["list"], list):
-                            messages.extend(response["list"])
-                        
-                        page_info = response.get("pageInfo", {})
-                        has_more = page_info.get("hasNextPage", False)
-                        page += 1
-                        
-                        # Add a small delay to avoid rate limiting
-                        if has_more:
-                            time.sleep(0.1)
+                if page_info.get("hasNextPage", False):
+                    messages.extend(
+                        self._fetch_remaining_message_pages(conversation_id, page_info)
+                    )
         
         return {
             "conversation": conversation,
             "messages": messages
         }
     
+    def _fetch_remaining_message_pages(
+        self,
+        conversation_id: str,
+        page_info: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch message pages 2..n of a conversation.
+        
+        When the first page reports totalRows and pageSize the remaining pages
+        are requested in parallel; otherwise pages are fetched sequentially.
+        
+        Args:
+            conversation_id: Conversation ID
+            page_info: pageInfo of the first messages page
+            
+        Returns:
+            Messages from the remaining pages, in page order
+        """
+        where = self._eq("conversation_id", conversation_id)
+        messages = []
+        
+        total_rows = page_info.get("totalRows")
+        page_size = page_info.get("pageSize")
+        
+        if total_rows and page_size:
+            n_pages = math.ceil(total_rows / page_size)
+            endpoints = [self._get_endpoint("Messages")] * (n_pages - 1)
+            params_list = [
+                {"where": where, "sort": "created_at", "limit": page_size, "page": page}
+                for page in range(2, n_pages + 1)
+            ]
+            
+            responses = self.api_client.http_client.parallel_get(endpoints, params_list)
+            
+            for page, response in enumerate(responses, start=2):
+                if isinstance(response, Exception):
+                    self.logger.error(
+                        f"Error fetching messages page {page} for conversation {conversation_id}: {str(response)}"
+                    )
+                    raise response
+                
+                records = json_utils.loads(response.content).get("list")
+                if records and isinstance(records, list):
+                    messages.extend(records)
+            
+            return messages
+        
+        # Fall back to sequential fetching when the total count is unknown
+        page = 2
+        has_more = True
+        while has_more:
+            response = self.fetch_records(
+                table_name="Messages",
+                where=where,
+                sort="created_at",
+                page=page
+            )
+            
+            if response.get("list") and isinstance(response["list"], list):
+                messages.extend(response["list"])
+            
+            page_info = response.get("pageInfo", {})
+            has_more = page_info.get("hasNextPage", False)
+            page += 1
+        
+        return messages
+    
     def get_user_conversations(
         self,
         user_id: str,
@@ -317,7 +761,7 @@ class NocoDBClient:
         """
         return self.fetch_records(
             table_name="Conversation",
-            where=f"(from_end_user_id,eq,{user_id})",
+            where=self._eq("from_end_user_id", user_id),
             sort="created_at,desc",
             limit=limit,
             page=page
@@ -325,23 +769,58 @@ class NocoDBClient:
     
     def get_multiple_conversations(
         self,
-        conversation_ids: List[str]
+        conversation_ids: List[str],
+        batch_size: int = 50
     ) -> List[Dict[str, Any]]:
         """
-        Get multiple conversations in parallel.
+        Get multiple conversations using batched `in` queries.
         
         Args:
             conversation_ids: List of conversation IDs
+            batch_size: Number of IDs per request (keeps URLs a sane length)
             
         Returns:
-            List of conversations
+            List of conversations in the same order as conversation_ids
+            (None for conversations that were not found)
         """
         if not conversation_ids:
             return []
         
-        # Prepare endpoints and parameters
+        conversations_by_id = {}
+        
+        for i in range(0, len(conversation_ids), batch_size):
+            chunk = conversation_ids[i:i + batch_size]
+            
+            try:
+                response = self.fetch_records(
+                    table_name="Conversation",
+                    where=_WHERE_ID_IN.format(",".join(map(str, chunk))),
+                    limit=MAX_PAGE_SIZE
+                )
+            except requests.exceptions.HTTPError as e:
+                self.logger.warning(
+                    f"Batched conversation lookup failed, falling back to per-ID requests: {str(e)}"
+                )
+                conversations_by_id.update(self._get_conversations_by_id(chunk))
+                continue
+            
+            for conversation in response.get("list", []):
+                conversations_by_id[str(conversation.get("id"))] = conversation
+        
+        return [conversations_by_id.get(str(conv_id)) for conv_id in conversation_ids]
+    
+    def _get_conversations_by_id(self, conversation_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get conversations with one parallel request per ID.
+        
+        Args:
+            conversation_ids: List of conversation IDs
+            
+        Returns:
+            Dictionary mapping conversation IDs to conversations
+        """
         endpoint = self._get_endpoint("Conversation")
-        params_list = [{"where": f"(id,eq,{conv_id})"} for conv_id in conversation_ids]
+        params_list = [{"where": self._eq("id", conv_id)} for conv_id in conversation_ids]
         
         # Make parallel requests
         responses = self.api_client.http_client.parallel_get(
@@ -349,23 +828,106 @@ class NocoDBClient:
             params_list
         )
         
-        # Process responses
-        conversations = []
-        for i, response in enumerate(responses):
+        # Responses may arrive in any order, so key them by the returned ID
+        conversations_by_id = {}
+        for response in responses:
             if isinstance(response, Exception):
-                self.logger.error(f"Error fetching conversation {conversation_ids[i]}: {str(response)}")
-                conversations.append(None)
-            else:
-                response_data = response.json()
-                if response_data.get("list") and len(response_data["list"]) > 0:
-                    conversations.append(response_data["list"][0])
-                else:
-                    conversations.append(None)
+                self.logger.error(f"Error fetching conversation: {str(response)}")
+                continue
+            
+            response_data = json_utils.loads(response.content)
+            if response_data.get("list"):
+                conversation = response_data["list"][0]
+                conversations_by_id[str(conversation.get("id"))] = conversation
+        
+        return conversations_by_id
+    
+    def get_messages_by_conversation(
+        self,
+        conversation_ids: List[str],
+        table_name: str = "Messages",
+        batch_size: int = 50,
+        fields: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the messages of many conversations using batched `in` queries.
+        
+        Args:
+            conversation_ids: List of conversation IDs
+            table_name: Name of the messages table
+            batch_size: Number of IDs per query (keeps URLs a sane length)
+            fields: Comma-separated columns to return; must include
+                conversation_id (all columns if None)
+            
+        Returns:
+            Dictionary mapping every conversation ID to its messages sorted by
+            created_at (an empty list for conversations without messages)
+        """
+        messages_by_id = {}
+        
+        for i in range(0, len(conversation_ids), batch_size):
+            chunk = conversation_ids[i:i + batch_size]
+            
+            try:
+                rows = list(self.iter_records(
+                    table_name,
+                    where=_WHERE_CONV_ID_IN.format(",".join(map(str, chunk))),
+                    sort="conversation_id,created_at",
+                    fields=fields
+                ))
+            except requests.exceptions.HTTPError as e:
+                self.logger.warning(
+                    f"Batched messages lookup failed, falling back to per-conversation requests: {str(e)}"
+                )
+                messages_by_id.update(self._get_messages_by_id(chunk, table_name, fields))
+                continue
+            
+            # Rows arrive sorted by conversation, so each group is contiguous
+            for conv_id, group in groupby(rows, key=itemgetter("conversation_id")):
+                messages_by_id.setdefault(str(conv_id), []).extend(group)
         
-        return conversations
+        return {conv_id: messages_by_id.get(str(conv_id), []) for conv_id in conversation_ids}
+    
+    def _get_messages_by_id(
+        self,
+        conversation_ids: List[str],
+        table_name: str,
+        fields: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the messages of several conversations with concurrent per-conversation queries.
+        
+        Args:
+            conversation_ids: List of conversation IDs
+            table_name: Name of the messages table
+            fields: Comma-separated columns to return (all columns if None)
+            
+        Returns:
+            Dictionary mapping conversation IDs (as strings) to their messages
+        """
+        def fetch_messages(conv_id):
+            return str(conv_id), self.fetch_all_records(
+                table_name,
+                where=self._eq("conversation_id", conv_id),
+                sort="created_at",
+                fields=fields
+            )
+        
+        # Failed fetches come back as None; they are retried once sequentially
+        # so that errors propagate instead of silently dropping messages
+        messages_by_id = dict(
+            result for result in thread_pool_manager.map_io(fetch_messages, conversation_ids)
+            if result is not None
+        )
+        for conv_id in conversation_ids:
+            if str(conv_id) not in messages_by_id:
+                messages_by_id.update([fetch_messages(conv_id)])
+        
+        return messages_by_id
     
     def close(self):
         """Close the API client."""
+        self._page_executor.shutdown(wait=True)
         self.api_client.close()
     
     def __enter__(self):
@@ -375,3 +937,142 @@ class NocoDBClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager."""
         self.close()
+
+
+class BulkMutationBatcher:
+    """
+    Coalesce concurrent single-record mutations into NocoDB bulk requests.
+    
+    Records passed to add() are queued and flushed by a background thread
+    when batch_size records are waiting or max_wait_ms has passed since the
+    first one arrived. Each flush groups the records by operation ("create"
+    or "update") and sends one bulk request per group. Each add() returns a
+    future resolved with that record's entry from the bulk response.
+    """
+    
+    _STOP = object()
+    
+    def __init__(
+        self,
+        client: NocoDBClient,
+        table_name: str,
+        batch_size: int = BULK_BATCH_SIZE,
+        max_wait_ms: int = BULK_MAX_WAIT_MS
+    ):
+        """
+        Initialize the batcher and start its flush thread.
+        
+        Args:
+            client: NocoDB client used for the bulk requests
+            table_name: Name of the table to write to
+            batch_size: Maximum number of records per flush
+            max_wait_ms: Maximum time a record waits before being flushed
+        """
+        self.client = client
+        self.table_name = table_name
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.logger = logging.getLogger(__name__)
+        
+        self._bulk_methods = {
+            "create": client.create_records,
+            "update": client.update_records
+        }
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"nocodb-bulk-{table_name}",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def add(self, record: Dict[str, Any], op: str = "create") -> Future:
+        """
+        Queue a record for a bulk mutation.
+        
+        Args:
+            record: Record data; for updates it must contain the record id
+            op: Operation to perform, "create" or "update"
+            
+        Returns:
+            Future resolved with the record's entry from the bulk response,
+            or with the bulk request's exception if it failed
+        """
+        if op not in self._bulk_methods:
+            raise ValueError(f"Unsupported bulk operation: {op}")
+        if self._closed:
+            raise RuntimeError(f"{type(self).__name__} is closed")
+        
+        future = Future()
+        self._queue.put((op, record, future))
+        return future
+    
+    def _run(self) -> None:
+        """Collect queued records into batches and flush them."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._flush(batch)
+    
+    def _flush(self, batch: List[Any]) -> None:
+        """
+        Send one bulk request per operation and resolve the records' futures.
+        
+        Args:
+            batch: List of (op, record, future) tuples
+        """
+        by_op = {}
+        for op, record, future in batch:
+            by_op.setdefault(op, []).append((record, future))
+        
+        for op, items in by_op.items():
+            records = [record for record, _ in items]
+            try:
+                results = self._bulk_methods[op](self.table_name, records)
+            except Exception as e:
+                self.logger.error(f"Bulk {op} of {len(records)} records in {self.table_name} failed: {str(e)}")
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            
+            for i, (_, future) in enumerate(items):
+                future.set_result(results[i] if i < len(results) else None)
+    
+    def close(self) -> None:
+        """Flush pending records and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+    
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context manager."""
+        self.close()
+
+
+# Kept for callers that only batch inserts
+BulkCreateBatcher = BulkMutationBatcher
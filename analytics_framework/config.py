@@ -1,7 +1,10 @@
 """Configuration settings for the analytics data collection."""
 
+import atexit
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -11,6 +14,11 @@ load_dotenv()
 NOCODB_BASE_URL = os.getenv("NOCODB_BASE_URL")
 NOCODB_API_TOKEN = os.getenv("NOCODB_API_TOKEN")
 NOCODB_PROJECT_ID = os.getenv("NOCODB_PROJECT_ID")
+NOCODB_CACHE_ENABLED = os.getenv("NOCODB_CACHE_ENABLED", "false").lower() == "true"
+NOCODB_CACHE_TTL = int(os.getenv("NOCODB_CACHE_TTL", "60"))
+NOCODB_CACHE_MAXSIZE = int(os.getenv("NOCODB_CACHE_MAXSIZE", "10000"))
+# Client-side request quota in requests per second (0 disables it)
+NOCODB_RATE_LIMIT = float(os.getenv("NOCODB_RATE_LIMIT", "0"))
 
 # MongoDB Configuration
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
@@ -45,11 +53,13 @@ AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 PARQUET_STORAGE_ENABLED = os.getenv("PARQUET_STORAGE_ENABLED", "true").lower() == "true"
 PARQUET_BASE_DIR = os.getenv("PARQUET_BASE_DIR", "./data/parquet")
 PARQUET_PARTITION_BY = os.getenv("PARQUET_PARTITION_BY", "year,month,day").split(",")
-PARQUET_COMPRESSION = os.getenv("PARQUET_COMPRESSION", "snappy")
+PARQUET_COMPRESSION = os.getenv("PARQUET_COMPRESSION", "zstd")
+PARQUET_COMPRESSION_LEVEL = int(os.getenv("PARQUET_COMPRESSION_LEVEL", "1"))
 PARQUET_ROW_GROUP_SIZE = int(os.getenv("PARQUET_ROW_GROUP_SIZE", "100000"))
 PARQUET_PAGE_SIZE = int(os.getenv("PARQUET_PAGE_SIZE", "8192"))
 PARQUET_TARGET_FILE_SIZE_MB = int(os.getenv("PARQUET_TARGET_FILE_SIZE_MB", "128"))
 PARQUET_MAX_RECORDS_PER_FILE = int(os.getenv("PARQUET_MAX_RECORDS_PER_FILE", "50000"))
+PARQUET_MAX_PENDING_UPLOADS = int(os.getenv("PARQUET_MAX_PENDING_UPLOADS", "2"))
 
 # Multi-Threading Configuration
 ENABLE_MULTITHREADING = os.getenv("ENABLE_MULTITHREADING", "true").lower() == "true"
@@ -57,6 +67,8 @@ MAX_WORKERS = int(os.getenv("MAX_WORKERS", str(os.cpu_count() or 4)))
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1000"))
 IO_THREADS = int(os.getenv("IO_THREADS", "4"))
 PROCESSING_THREADS = int(os.getenv("PROCESSING_THREADS", "4"))
+# Batches smaller than this run on the processing threads instead of the process pool
+PROCESS_POOL_MIN_ITEMS = int(os.getenv("PROCESS_POOL_MIN_ITEMS", "32"))
 
 # GPU Configuration
 ENABLE_GPU = os.getenv("ENABLE_GPU", "false").lower() == "true"
@@ -135,19 +147,39 @@ def validate_config():
 
 
 def setup_logging():
-    """Set up logging configuration."""
+    """
+    Set up logging configuration.
+    
+    Records are handed to a queue and written to the console and LOG_FILE by
+    a background listener thread, so logging threads never block on I/O.
+    Safe to call more than once: handlers are only attached when the root
+    logger has none, so the log file is not reopened and records are not
+    duplicated.
+    """
     numeric_level = getattr(logging, LOG_LEVEL.upper(), None)
     if not isinstance(numeric_level, int):
         numeric_level = logging.INFO
     
-    logging.basicConfig(
-        level=numeric_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(LOG_FILE)
-        ]
-    )
+    root_logger = logging.getLogger()
+    if root_logger.hasHandlers():
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.StreamHandler(),
+        logging.FileHandler(LOG_FILE)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Worker threads only enqueue records; a background listener does the I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger.setLevel(numeric_level)
+    root_logger.addHandler(QueueHandler(log_queue))
     
     # Reduce verbosity of some loggers
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -157,15 +189,3 @@ def setup_logging():
     logging.getLogger('parquet').setLevel(logging.WARNING)
     
     logging.info(f"Logging initialized at level {LOG_LEVEL}")
-
-
-# Initialize logging when the module is imported
-setup_logging()
-
-# Validate configuration
-try:
-    validate_config()
-    logging.info("Configuration validated successfully")
-except ValueError as e:
-    logging.warning(f"Configuration validation failed: {str(e)}")
-    logging.warning("Continuing with partial configuration")
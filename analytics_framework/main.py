@@ -2,10 +2,15 @@
 
 import argparse
 import logging
-from typing import Optional, Tuple
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .config import (
     BATCH_SIZE,
+    PARQUET_MAX_PENDING_UPLOADS,
     NOCODB_CONVERSATION_TABLE,
     NOCODB_MESSAGES_TABLE,
     MONGODB_CONVERSATIONS_COLLECTION,
@@ -19,10 +24,12 @@ from .config import (
     validate_config
 )
 from .api.nocodb_client import NocoDBClient
-from .storage.mongodb_client import MongoDBClient
+from .storage.mongodb.client import MongoDBClient
+from .storage.mongodb.base_client import ANALYTICS_WRITE_CONCERN
 from .storage.parquet_storage import ParquetStorage
-from .processors.data_processor import DataProcessor
+from .processors.data_processor import DataProcessor, CONVERSATION_FIELDS, MESSAGE_FIELDS
 from .utils.processing_state import create_processing_state
+from .utils.thread_pool import thread_pool_manager
 
 
 def create_mongodb_indexes(mongo_client: MongoDBClient) -> None:
@@ -36,82 +43,259 @@ def create_mongodb_indexes(mongo_client: MongoDBClient) -> None:
     pass
 
 
-def process_conversation_batch(
+def fetch_conversation_batches(
     nocodb_client: NocoDBClient,
-    mongo_client: Optional[MongoDBClient],
-    parquet_storage: Optional[ParquetStorage],
-    data_processor: DataProcessor,
-    processing_state,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     app_id: Optional[str] = None,
     last_id: Optional[str] = None,
     batch_size: int = BATCH_SIZE
-) -> Tuple[int, Optional[str]]:
+) -> Iterator[List[Dict[str, Any]]]:
     """
-    Process a batch of conversations.
+    Fetch conversations batch by batch, in ID order.
     
     Args:
         nocodb_client: NocoDB client
-        mongo_client: MongoDB client (can be None to skip MongoDB storage)
-        data_processor: Data processor
-        processing_state: Processing state tracker
         start_date: Start date for filtering conversations
         end_date: End date for filtering conversations
         app_id: App ID for filtering conversations
-        last_id: Last processed conversation ID
+        last_id: Only fetch conversations after this ID
         batch_size: Batch size
         
-    Returns:
-        Tuple of (processed_count, last_processed_id)
+    Yields:
+        Non-empty lists of conversations
     """
-    # Build where clause
-    where_clauses = []
+    # Build the filters that do not change between batches
+    static_clauses = []
     
-    if last_id:
-        where_clauses.append(f"(id,gt,{last_id})")
-        
     if start_date:
-        where_clauses.append(f"(created_at,gte,{start_date})")
+        static_clauses.append(f"(created_at,gte,{start_date})")
         
     if end_date:
-        where_clauses.append(f"(created_at,lt,{end_date})")
+        static_clauses.append(f"(created_at,lt,{end_date})")
         
     if app_id:
-        where_clauses.append(f"(app_id,eq,{app_id})")
+        static_clauses.append(f"(app_id,eq,{app_id})")
     
-    where_clause = "~and".join(where_clauses) if where_clauses else None
+    static_where = "~and".join(static_clauses)
     
-    # Fetch conversations
-    conversations = nocodb_client.fetch_records(
-        NOCODB_CONVERSATION_TABLE,
-        where=where_clause,
-        sort="id",
-        limit=batch_size
-    )
+    while True:
+        # Keyset pagination: only the id bound changes between batches
+        if last_id:
+            where_clause = f"(id,gt,{last_id})~and{static_where}" if static_where else f"(id,gt,{last_id})"
+        else:
+            where_clause = static_where or None
+        
+        conversations = nocodb_client.fetch_records(
+            NOCODB_CONVERSATION_TABLE,
+            where=where_clause,
+            sort="id",
+            limit=batch_size,
+            fields=CONVERSATION_FIELDS
+        )
+        
+        conversation_list = conversations.get("list", [])
+        if not conversation_list:
+            return
+        
+        yield conversation_list
+        last_id = conversation_list[-1]["id"]
+
+
+def prefetch(iterable: Iterable[Any], maxsize: int = 2) -> Iterator[Any]:
+    """
+    Produce items from an iterable on a background thread.
+    
+    Up to maxsize items are fetched ahead while the caller works on the
+    current one. Exceptions raised by the iterable are re-raised to the
+    caller, and closing the generator stops the background thread.
+    
+    Args:
+        iterable: Iterable to consume in the background
+        maxsize: Maximum number of items fetched ahead
+        
+    Yields:
+        Items of the iterable, in order
+    """
+    items = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+    done = object()
+    
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((done, e))
+            return
+        put((done, None))
+    
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
+
+
+def store_parquet_batch(
+    parquet_storage: ParquetStorage,
+    processed_docs: List[Dict[str, Any]],
+    user_analytics: List[Dict[str, Any]],
+    reports: List[Dict[str, Any]]
+) -> None:
+    """
+    Store a processed batch in Parquet format.
+    
+    Args:
+        parquet_storage: Parquet storage
+        processed_docs: Processed conversation documents
+        user_analytics: Updated user analytics documents
+        reports: Analytics reports
+    """
+    # Store conversations in Parquet format
+    stored_paths = parquet_storage.store_conversations(processed_docs)
+    logging.info(f"Stored conversations in Parquet format at: {', '.join(stored_paths)}")
+    
+    # Store user analytics in Parquet format
+    user_analytics_path = parquet_storage.store_user_analytics(user_analytics)
+    if user_analytics_path:
+        logging.info(f"Stored user analytics in Parquet format at: {user_analytics_path}")
+    
+    # Store analytics reports in Parquet format
+    report_paths = parquet_storage.store_analytics_reports(reports)
+    if report_paths:
+        logging.info(f"Stored analytics reports in Parquet format at: {', '.join(report_paths.values())}")
+
+
+def wait_for_uploads(
+    pending_uploads: Deque[Tuple[Future, List[Dict[str, Any]]]],
+    processing_state,
+    max_pending: int = 0
+) -> int:
+    """
+    Wait for background Parquet uploads until at most max_pending remain.
+    
+    Processing state is updated on the calling thread for the documents of
+    each upload that succeeded, in batch order. The first failed upload is
+    recorded as an error and re-raised; the uploads queued behind it are
+    cancelled and never checkpointed, so a resumed run starts at the failed
+    batch instead of skipping it.
+    
+    Args:
+        pending_uploads: Queue of (future, documents to checkpoint) pairs, oldest first
+        processing_state: Processing state tracker
+        max_pending: Number of uploads allowed to stay in flight
+        
+    Returns:
+        Number of documents checkpointed
+    """
+    checkpointed = 0
+    
+    while len(pending_uploads) > max_pending:
+        future, checkpoint_docs = pending_uploads.popleft()
+        try:
+            future.result()
+        except Exception as e:
+            logging.error(f"Error storing data in Parquet format: {str(e)}")
+            processing_state.record_error(str(e))
+            
+            # Later batches must not move the checkpoint past this one
+            for later_future, _ in pending_uploads:
+                later_future.cancel()
+            pending_uploads.clear()
+            raise
+        
+        checkpoint(processing_state, checkpoint_docs)
+        checkpointed += len(checkpoint_docs)
+    
+    return checkpointed
+
+
+def checkpoint(processing_state, docs: List[Dict[str, Any]]) -> None:
+    """
+    Record a batch of stored documents in the processing state with one update.
+    
+    Args:
+        processing_state: Processing state tracker
+        docs: Stored documents, in processing order
+    """
+    if docs:
+        processing_state.update_last_processed(
+            conversation_id=docs[-1]["_id"],
+            timestamp=docs[-1].get("created_at"),
+            count=len(docs)
+        )
+
+
+def process_conversation_batch(
+    nocodb_client: NocoDBClient,
+    mongo_client: Optional[MongoDBClient],
+    parquet_storage: Optional[ParquetStorage],
+    data_processor: DataProcessor,
+    processing_state,
+    conversation_list: List[Dict[str, Any]],
+    last_id: Optional[str] = None,
+    upload_pool: Optional[Executor] = None,
+    pending_uploads: Optional[Deque[Tuple[Future, List[Dict[str, Any]]]]] = None
+) -> Tuple[int, Optional[str], int]:
+    """
+    Process a batch of conversations.
     
-    conversation_list = conversations.get("list", [])
+    Args:
+        nocodb_client: NocoDB client
+        mongo_client: MongoDB client (can be None to skip MongoDB storage)
+        parquet_storage: Parquet storage (can be None to skip Parquet storage)
+        data_processor: Data processor
+        processing_state: Processing state tracker
+        conversation_list: Conversations fetched from NocoDB
+        last_id: Last processed conversation ID
+        upload_pool: Executor to store Parquet data on in the background
+            (stored synchronously if None)
+        pending_uploads: Queue receiving each background upload with the
+            documents to checkpoint once it succeeds (required with upload_pool)
+        
+    Returns:
+        Tuple of (processed_count, last_processed_id, queued_count), where
+        queued_count documents are counted and checkpointed by
+        wait_for_uploads once their background upload succeeds
+    """
     if not conversation_list:
-        return 0, last_id
+        return 0, last_id, 0
     
     logging.info(f"Processing batch of {len(conversation_list)} conversations")
     
     # Process each conversation
     processed_count = 0
+    queued_count = 0
     last_processed_id = last_id
     processed_conversations = []
     
-    # Fetch messages for all conversations in batch
+    # Fetch messages for all conversations in batch with `in` queries
     conversation_ids = [conv["id"] for conv in conversation_list]
-    messages_by_conversation = {}
-    
-    for conversation_id in conversation_ids:
-        messages = nocodb_client.fetch_all_records(
-            NOCODB_MESSAGES_TABLE,
-            where=f"(conversation_id,eq,{conversation_id})",
-            sort="created_at"
-        )
-        messages_by_conversation[conversation_id] = messages
+    messages_by_conversation = nocodb_client.get_messages_by_conversation(
+        conversation_ids,
+        table_name=NOCODB_MESSAGES_TABLE,
+        fields=MESSAGE_FIELDS
+    )
     
     # Process conversations in parallel
     processed_docs = data_processor.process_conversations_batch(
@@ -119,14 +303,21 @@ def process_conversation_batch(
         messages_by_conversation
     )
     
+    # Conversations that failed to process come back as None
+    processed_docs = [doc for doc in processed_docs if doc is not None]
+    if not processed_docs:
+        logging.debug("No conversations in batch were processed, skipping storage")
+        return 0, last_id, 0
+    
     # Extract categories for all conversations
     categories_by_conversation = data_processor.extract_categories_batch(processed_docs)
     
     # Add categories to processed documents
+    get_categories = categories_by_conversation.get
     for doc in processed_docs:
-        doc_id = doc.get("_id")
-        if doc_id in categories_by_conversation:
-            doc["categories"] = categories_by_conversation[doc_id]
+        categories = get_categories(doc["_id"])
+        if categories is not None:
+            doc["categories"] = categories
     
     # Store in MongoDB and/or Parquet if enabled
     if mongo_client or parquet_storage:
@@ -134,13 +325,12 @@ def process_conversation_batch(
         user_ids = set(doc.get("from_end_user_id") for doc in processed_docs if doc.get("from_end_user_id"))
         existing_user_analytics = {}
         
-        for user_id in user_ids:
-            user_doc = mongo_client.base_client.find_one(
+        if mongo_client and user_ids:
+            user_docs = mongo_client.base_client.find(
                 MONGODB_USER_ANALYTICS_COLLECTION,
-                {"_id": user_id}
+                {"_id": {"$in": list(user_ids)}}
             )
-            if user_doc:
-                existing_user_analytics[user_id] = user_doc
+            existing_user_analytics = {user_doc["_id"]: user_doc for user_doc in user_docs}
         
         # Update user analytics
         updated_user_analytics = data_processor.update_user_analytics_batch(
@@ -149,100 +339,103 @@ def process_conversation_batch(
         )
         
         # Generate analytics reports
-        daily_reports = data_processor.generate_analytics_reports(processed_docs, "daily")
-        weekly_reports = data_processor.generate_analytics_reports(processed_docs, "weekly")
-        monthly_reports = data_processor.generate_analytics_reports(processed_docs, "monthly")
+        daily_reports, weekly_reports, monthly_reports = data_processor.generate_analytics_reports(processed_docs)
+        all_reports = daily_reports + weekly_reports + monthly_reports
         
         # Store conversations in MongoDB
         if mongo_client:
+            try:
+                # Save all conversations in one unordered bulk write
+                failed_conversations = mongo_client.conversation.bulk_save(processed_docs)
+            except Exception as e:
+                logging.error(f"Error storing conversations: {str(e)}")
+                failed_conversations = {doc.get("_id"): str(e) for doc in processed_docs}
+            
+            stored_docs = []
             for doc in processed_docs:
-                try:
-                    # Use the conversation client to save the conversation
-                    # This ensures messages are properly stored in the messages array
-                    mongo_client.conversation.save_conversation(doc)
-                    
-                    # Update processing state
-                    processing_state.update_last_processed(
-                        conversation_id=doc["_id"],
-                        timestamp=doc.get("created_at")
-                    )
-                    
-                    processed_count += 1
-                    last_processed_id = doc["_id"]
-                    
-                except Exception as e:
-                    logging.error(f"Error storing conversation {doc.get('_id')}: {str(e)}")
-                    processing_state.record_error(str(e), conversation_id=doc.get("_id"))
+                error = failed_conversations.get(doc["_id"])
+                if error is not None:
+                    logging.error(f"Error storing conversation {doc['_id']}: {error}")
+                    processing_state.record_error(error, conversation_id=doc["_id"])
+                else:
+                    stored_docs.append(doc)
+            
+            # Update processing state
+            checkpoint(processing_state, stored_docs)
+            
+            if stored_docs:
+                processed_count += len(stored_docs)
+                last_processed_id = stored_docs[-1]["_id"]
             
             # Store user analytics in MongoDB
-            for user_doc in updated_user_analytics:
-                try:
-                    mongo_client.base_client.update_one(
-                        MONGODB_USER_ANALYTICS_COLLECTION,
-                        {"_id": user_doc["_id"]},
-                        {"$set": user_doc},
-                        upsert=True
-                    )
-                except Exception as e:
-                    logging.error(f"Error storing user analytics for {user_doc.get('_id')}: {str(e)}")
+            try:
+                result = mongo_client.base_client.bulk_upsert(
+                    MONGODB_USER_ANALYTICS_COLLECTION,
+                    updated_user_analytics,
+                    write_concern=ANALYTICS_WRITE_CONCERN
+                )
+                logging.info(
+                    f"Stored user analytics: {result['nUpserted']} upserted, "
+                    f"{result['nModified']} modified, {result.get('writeErrors', 0)} failed"
+                )
+            except Exception as e:
+                logging.error(f"Error storing user analytics: {str(e)}")
             
             # Store analytics reports in MongoDB
-            all_reports = daily_reports + weekly_reports + monthly_reports
-            for report in all_reports:
-                try:
-                    mongo_client.base_client.update_one(
-                        MONGODB_ANALYTICS_REPORTS_COLLECTION,
-                        {"_id": report["_id"]},
-                        {"$set": report},
-                        upsert=True
-                    )
-                except Exception as e:
-                    logging.error(f"Error storing analytics report {report.get('_id')}: {str(e)}")
+            try:
+                result = mongo_client.base_client.bulk_upsert(
+                    MONGODB_ANALYTICS_REPORTS_COLLECTION,
+                    all_reports,
+                    write_concern=ANALYTICS_WRITE_CONCERN
+                )
+                logging.info(
+                    f"Stored analytics reports: {result['nUpserted']} upserted, "
+                    f"{result['nModified']} modified, {result.get('writeErrors', 0)} failed"
+                )
+            except Exception as e:
+                logging.error(f"Error storing analytics reports: {str(e)}")
         
         # Store data in Parquet format if enabled
         if parquet_storage:
-            try:
-                # Store conversations in Parquet format
-                stored_paths = parquet_storage.store_conversations(processed_docs)
-                logging.info(f"Stored conversations in Parquet format at: {', '.join(stored_paths)}")
-                
-                # Store user analytics in Parquet format
-                user_analytics_path = parquet_storage.store_user_analytics(updated_user_analytics)
-                if user_analytics_path:
-                    logging.info(f"Stored user analytics in Parquet format at: {user_analytics_path}")
-                
-                # Store analytics reports in Parquet format
-                all_reports = daily_reports + weekly_reports + monthly_reports
-                report_paths = parquet_storage.store_analytics_reports(all_reports)
-                if report_paths:
-                    logging.info(f"Stored analytics reports in Parquet format at: {', '.join(report_paths.values())}")
-                
-                # Update processing state if MongoDB is not enabled
-                if not mongo_client:
-                    for doc in processed_docs:
-                        processing_state.update_last_processed(
-                            conversation_id=doc["_id"],
-                            timestamp=doc.get("created_at")
-                        )
-                        
-                        processed_count += 1
-                        last_processed_id = doc["_id"]
-            except Exception as e:
-                logging.error(f"Error storing data in Parquet format: {str(e)}")
-                processing_state.record_error(str(e))
+            # Update processing state here only if MongoDB is not enabled
+            checkpoint_docs = [] if mongo_client else processed_docs
+            
+            if upload_pool is not None:
+                # Upload in the background while the next batch is processed
+                future = upload_pool.submit(
+                    store_parquet_batch,
+                    parquet_storage,
+                    processed_docs,
+                    updated_user_analytics,
+                    all_reports
+                )
+                pending_uploads.append((future, checkpoint_docs))
+                queued_count = len(checkpoint_docs)
+            else:
+                try:
+                    store_parquet_batch(parquet_storage, processed_docs, updated_user_analytics, all_reports)
+                    
+                    checkpoint(processing_state, checkpoint_docs)
+                    
+                    if checkpoint_docs:
+                        processed_count += len(checkpoint_docs)
+                        last_processed_id = checkpoint_docs[-1]["_id"]
+                except Exception as e:
+                    logging.error(f"Error storing data in Parquet format: {str(e)}")
+                    processing_state.record_error(str(e))
     else:
         # Just update processing state
-        for doc in processed_docs:
-            processing_state.update_last_processed(
-                conversation_id=doc["_id"],
-                timestamp=doc.get("created_at")
-            )
-            
-            processed_count += 1
-            last_processed_id = doc["_id"]
+        checkpoint(processing_state, processed_docs)
+        
+        if processed_docs:
+            processed_count += len(processed_docs)
+            last_processed_id = processed_docs[-1]["_id"]
     
-    logging.info(f"Completed processing batch. Processed {processed_count}/{len(conversation_list)} conversations")
-    return processed_count, last_processed_id
+    logging.info(
+        f"Completed processing batch. Processed {processed_count}/{len(conversation_list)} conversations"
+        + (f", {queued_count} awaiting upload" if queued_count else "")
+    )
+    return processed_count, last_processed_id, queued_count
 
 
 def main():
@@ -305,25 +498,62 @@ def main():
         # Process data
         total_processed = 0
         
-        while True:
-            processed_count, last_id = process_conversation_batch(
-                nocodb_client=nocodb_client,
-                mongo_client=mongo_client,
-                parquet_storage=parquet_storage,
-                data_processor=data_processor,
-                processing_state=processing_state,
+        # Fetch the next batches from NocoDB while the current one is processed
+        batches = prefetch(
+            fetch_conversation_batches(
+                nocodb_client,
                 start_date=args.start_date,
                 end_date=args.end_date,
                 app_id=args.app_id,
                 last_id=last_id,
                 batch_size=args.batch_size
-            )
+            ),
+            maxsize=2
+        )
+        
+        # Parquet uploads run one at a time in the background, so writes to the
+        # same partition files never overlap and stay in batch order
+        upload_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parquet-upload")
+        pending_uploads = deque()
+        
+        try:
+            for conversation_list in batches:
+                processed_count, last_id, queued_count = process_conversation_batch(
+                    nocodb_client=nocodb_client,
+                    mongo_client=mongo_client,
+                    parquet_storage=parquet_storage,
+                    data_processor=data_processor,
+                    processing_state=processing_state,
+                    conversation_list=conversation_list,
+                    last_id=last_id,
+                    upload_pool=upload_pool,
+                    pending_uploads=pending_uploads
+                )
+                
+                total_processed += processed_count
+                
+                # Bound the number of batches held in memory for upload; a
+                # failed upload raises and ends the run as failed
+                total_processed += wait_for_uploads(
+                    pending_uploads, processing_state, PARQUET_MAX_PENDING_UPLOADS
+                )
+                
+                # If no conversations were processed, stop rather than skip past them
+                if processed_count == 0 and queued_count == 0:
+                    break
             
-            total_processed += processed_count
+            total_processed += wait_for_uploads(pending_uploads, processing_state)
+        finally:
+            batches.close()
             
-            # If no conversations were processed, we're done
-            if processed_count == 0:
-                break
+            # Only left over when the loop raised; still checkpoint the uploads
+            # that succeeded ahead of the failure, which is already recorded
+            if pending_uploads:
+                try:
+                    wait_for_uploads(pending_uploads, processing_state)
+                except Exception:
+                    pass
+            upload_pool.shutdown()
         
         logging.info(f"Data collection completed. Processed {total_processed} conversations.")
         processing_state.end_run(success=True, message=f"Successfully processed {total_processed} conversations")
@@ -333,6 +563,9 @@ def main():
         processing_state.record_error(str(e))
         processing_state.end_run(success=False, message=f"Failed with error: {str(e)}")
         raise
+    
+    finally:
+        thread_pool_manager.shutdown()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,22 @@
 """MongoDB schema definitions for the analytics framework."""
 
-from typing import Dict, List, Any, Optional
+import ast
+import sys
+import time
+from collections import namedtuple
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterable, List, Any, Optional, Sequence, Tuple, TypedDict
+)
 from datetime import datetime
+from operator import attrgetter
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from ..utils.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # MongoDB Schema Definitions
 
@@ -386,56 +401,613 @@ USER_ANALYTICS_SCHEMA = {
     }
 }
 
+
+# Canonical frozen lists, so repeated values such as ("string", "null") share one tuple
+_FROZEN_TUPLES: Dict[tuple, tuple] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a schema definition read-only.
+    
+    Dicts become MappingProxyType views, lists become shared tuples and strings
+    are interned. Both are still encoded to BSON as documents and arrays.
+    
+    Args:
+        value: Schema definition or part of one
+        
+    Returns:
+        Read-only equivalent of the value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(key): _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        frozen = tuple(_freeze(item) for item in value)
+        return _FROZEN_TUPLES.setdefault(frozen, frozen)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+CONVERSATION_ANALYTICS_SCHEMA = _freeze(CONVERSATION_ANALYTICS_SCHEMA)
+CONVERSATION_MESSAGES_SCHEMA = _freeze(CONVERSATION_MESSAGES_SCHEMA)
+CONVERSATION_CATEGORIES_SCHEMA = _freeze(CONVERSATION_CATEGORIES_SCHEMA)
+CONVERSATION_TRANSLATIONS_SCHEMA = _freeze(CONVERSATION_TRANSLATIONS_SCHEMA)
+ANALYTICS_REPORTS_SCHEMA = _freeze(ANALYTICS_REPORTS_SCHEMA)
+USER_ANALYTICS_SCHEMA = _freeze(USER_ANALYTICS_SCHEMA)
+
+
+def _without_items(schema: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Copy a frozen schema without the item schemas of some array properties.
+    
+    Args:
+        schema: Frozen schema definition
+        keys: Array properties whose items keyword is dropped
+        
+    Returns:
+        Frozen schema that only checks those properties are arrays
+    """
+    properties = dict(schema["properties"])
+    for key in keys:
+        properties[key] = MappingProxyType({
+            name: value for name, value in properties[key].items() if name != "items"
+        })
+    return MappingProxyType({**schema, "properties": MappingProxyType(properties)})
+
+
+# Validator variants for the conversations collection. The strict schema checks
+# every embedded message and category, which costs O(messages) per write. The
+# fast schema only checks top-level fields, for deployments where documents are
+# written through the model classes that already build those arrays.
+CONVERSATION_ANALYTICS_SCHEMA_STRICT = CONVERSATION_ANALYTICS_SCHEMA
+CONVERSATION_ANALYTICS_SCHEMA_FAST = _without_items(
+    CONVERSATION_ANALYTICS_SCHEMA, ("messages", "categories")
+)
+
+# Client-side Validation
+
+# Python types accepted for each BSON type (matched exactly, so bool is not an int)
+_BSON_PYTHON_TYPES = {
+    "string": (str,),
+    "int": (int,),
+    "long": (int,),
+    "double": (float,),
+    "bool": (bool,),
+    "object": (dict,),
+    "array": (list, tuple),
+    "null": (type(None),),
+    "date": (datetime,)
+}
+
+# Accepted Python types per bsonType value, shared between compiled programs
+_TYPE_SETS: Dict[Tuple[str, ...], frozenset] = {}
+
+# Validation program opcodes
+_OP_REQUIRE = 0
+_OP_TYPE = 1
+_OP_ITEMS = 2
+
+
+def compile_schema(schema: Dict[str, Any]) -> Tuple[Tuple[int, str, Any], ...]:
+    """
+    Compile a $jsonSchema definition into a flat validation program.
+    
+    The program is a tuple of (opcode, field, argument) instructions:
+    required-field checks first, then type checks and array item programs.
+    Only the bsonType, required, properties and items keywords are compiled.
+    
+    Args:
+        schema: Schema definition
+        
+    Returns:
+        Validation program for validate_document
+    """
+    program = [(_OP_REQUIRE, key, None) for key in schema.get("required", ())]
+    
+    for key, prop in schema.get("properties", {}).items():
+        bson_type = prop.get("bsonType")
+        if bson_type is not None:
+            type_names = (bson_type,) if isinstance(bson_type, str) else tuple(bson_type)
+            allowed = _TYPE_SETS.get(type_names)
+            if allowed is None:
+                allowed = _TYPE_SETS.setdefault(type_names, frozenset(
+                    python_type for name in type_names for python_type in _BSON_PYTHON_TYPES[name]
+                ))
+            program.append((_OP_TYPE, key, allowed))
+        
+        items = prop.get("items")
+        if items is not None:
+            program.append((_OP_ITEMS, key, compile_schema(items)))
+    
+    return tuple(program)
+
+
+def validate_document(
+    document: Dict[str, Any],
+    program: Tuple[Tuple[int, str, Any], ...],
+    fail_fast: bool = False
+) -> List[str]:
+    """
+    Validate a document against a compiled schema program.
+    
+    Args:
+        document: Document to validate
+        program: Program returned by get_program or compile_schema
+        fail_fast: Whether to stop at the first validation error
+        
+    Returns:
+        List of validation errors (empty if the document is valid)
+    """
+    errors = []
+    pending = [(program, document, "")]
+    
+    while pending:
+        program, document, path = pending.pop()
+        
+        for opcode, key, argument in program:
+            if opcode == _OP_REQUIRE:
+                if key not in document:
+                    errors.append(f"{path}{key}: missing required field")
+                    if fail_fast:
+                        return errors
+                continue
+            
+            if key not in document:
+                continue
+            value = document[key]
+            
+            if opcode == _OP_TYPE:
+                if type(value) not in argument:
+                    errors.append(f"{path}{key}: unexpected type {type(value).__name__}")
+                    if fail_fast:
+                        return errors
+            elif type(value) in (list, tuple):
+                for index, item in enumerate(value):
+                    if type(item) is dict:
+                        pending.append((argument, item, f"{path}{key}.{index}."))
+                    else:
+                        errors.append(f"{path}{key}.{index}: expected an object")
+                        if fail_fast:
+                            return errors
+    
+    return errors
+
+
+# Compiled programs keyed on the id of their schema; the schema is kept
+# alongside so the id cannot be reused while the entry exists
+_PROGRAMS: Dict[int, Tuple[Dict[str, Any], Tuple[Tuple[int, str, Any], ...]]] = {}
+
+
+def get_program(schema: Dict[str, Any]) -> Tuple[Tuple[int, str, Any], ...]:
+    """
+    Get the validation program of a schema, compiling it on first use.
+    
+    Args:
+        schema: Schema definition, such as CONVERSATION_ANALYTICS_SCHEMA
+        
+    Returns:
+        Validation program for validate_document
+    """
+    entry = _PROGRAMS.get(id(schema))
+    if entry is None:
+        entry = _PROGRAMS.setdefault(id(schema), (schema, compile_schema(schema)))
+    return entry[1]
+
 # MongoDB Indexes
 
-CONVERSATION_ANALYTICS_INDEXES = [
-    {"key": {"from_end_user_id": 1, "created_at": -1}},
-    {"key": {"app_id": 1, "created_at": -1}},
-    {"key": {"model_id": 1, "created_at": -1}},
-    {"key": {"created_at": 1}},
-    {"key": {"status": 1, "created_at": -1}},
-    {"key": {"categories.category_type": 1, "categories.category_value": 1}},
-    {"key": {"total_tokens": 1}},
-    {"key": {"total_price": 1}},
+# Index models are built once at import and passed to create_indexes as-is.
+
+CONVERSATION_ANALYTICS_INDEXES = (
+    IndexModel([("from_end_user_id", ASCENDING), ("created_at", DESCENDING)]),
+    IndexModel([("app_id", ASCENDING), ("created_at", DESCENDING)]),
+    IndexModel([("model_id", ASCENDING), ("created_at", DESCENDING)]),
+    IndexModel([("created_at", ASCENDING)]),
+    IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+    IndexModel([
+        ("categories.category_type", ASCENDING),
+        ("categories.category_value", ASCENDING)
+    ]),
+    IndexModel([("total_tokens", ASCENDING)]),
+    IndexModel([("total_price", ASCENDING)]),
     # Compound indexes for common queries
-    {"key": {"app_id": 1, "model_id": 1, "created_at": -1}},
-    {"key": {"from_end_user_id": 1, "status": 1, "created_at": -1}},
-    {"key": {"categories.category_type": 1, "categories.category_value": 1, "created_at": -1}},
-    {"key": {"model_id": 1, "total_tokens": 1, "total_price": 1}}
-]
-
-CONVERSATION_MESSAGES_INDEXES = [
-    {"key": {"conversation_id": 1}},
-    {"key": {"conversation_id": 1, "sequence_number": 1}},
-    {"key": {"parent_message_id": 1}}
-]
-
-CONVERSATION_CATEGORIES_INDEXES = [
-    {"key": {"conversation_id": 1}},
-    {"key": {"category_type": 1, "category_value": 1}}
-]
-
-CONVERSATION_TRANSLATIONS_INDEXES = [
-    {"key": {"conversation_id": 1}},
-    {"key": {"message_id": 1}},
-    {"key": {"language_code": 1, "conversation_id": 1}}
-]
-
-ANALYTICS_REPORTS_INDEXES = [
-    {"key": {"report_type": 1, "period_start": 1, "period_end": 1}},
-    {"key": {"created_at": 1}}
-]
-
-USER_ANALYTICS_INDEXES = [
-    {"key": {"total_conversations": 1}},
-    {"key": {"last_conversation_at": 1}}
-]
+    IndexModel([
+        ("app_id", ASCENDING), ("model_id", ASCENDING), ("created_at", DESCENDING)
+    ]),
+    IndexModel([
+        ("from_end_user_id", ASCENDING),
+        ("status", ASCENDING),
+        ("created_at", DESCENDING)
+    ]),
+    IndexModel([
+        ("categories.category_type", ASCENDING),
+        ("categories.category_value", ASCENDING),
+        ("created_at", DESCENDING)
+    ]),
+    IndexModel([
+        ("model_id", ASCENDING), ("total_tokens", ASCENDING), ("total_price", ASCENDING)
+    ])
+)
+
+CONVERSATION_MESSAGES_INDEXES = (
+    IndexModel([("conversation_id", ASCENDING)]),
+    IndexModel([("conversation_id", ASCENDING), ("sequence_number", ASCENDING)]),
+    IndexModel([("parent_message_id", ASCENDING)])
+)
+
+CONVERSATION_CATEGORIES_INDEXES = (
+    IndexModel([("conversation_id", ASCENDING)]),
+    IndexModel([("category_type", ASCENDING), ("category_value", ASCENDING)])
+)
+
+CONVERSATION_TRANSLATIONS_INDEXES = (
+    IndexModel([("conversation_id", ASCENDING)]),
+    IndexModel([("message_id", ASCENDING)]),
+    IndexModel([("language_code", ASCENDING), ("conversation_id", ASCENDING)])
+)
+
+ANALYTICS_REPORTS_INDEXES = (
+    IndexModel([
+        ("report_type", ASCENDING),
+        ("period_start", ASCENDING),
+        ("period_end", ASCENDING)
+    ]),
+    IndexModel([("created_at", ASCENDING)])
+)
+
+USER_ANALYTICS_INDEXES = (
+    IndexModel([("total_conversations", ASCENDING)]),
+    IndexModel([("last_conversation_at", ASCENDING)])
+)
 
 # Python Data Models
 
+# Documents returned by the models' to_dict methods. Nullable optional fields are
+# left out while unset, so none of the keys are guaranteed to be present.
+
+
+class ConversationAnalyticsDoc(TypedDict, total=False):
+    _id: str
+    app_id: str
+    model_provider: str
+    model_id: str
+    mode: str
+    name: str
+    summary: str
+    from_end_user_id: str
+    from_account_id: str
+    status: str
+    created_at: str
+    updated_at: str
+    is_deleted: bool
+    message_count: int
+    total_tokens: int
+    total_price: float
+    currency: str
+    system_instruction: str
+    system_instruction_tokens: int
+    analytics_metadata: Dict[str, Any]
+    messages: List[Dict[str, Any]]
+    categories: List[Dict[str, Any]]
+
+
+class ConversationMessageDoc(TypedDict, total=False):
+    _id: str
+    conversation_id: str
+    sequence_number: int
+    role: str
+    content: str
+    tokens: int
+    price: float
+    currency: str
+    created_at: str
+    model_id: str
+    parent_message_id: str
+    metadata: Dict[str, Any]
+
+
+class ConversationCategoryDoc(TypedDict, total=False):
+    _id: str
+    conversation_id: str
+    category_type: str
+    category_value: str
+    confidence_score: float
+    created_at: str
+    created_by: str
+
+
+class ConversationTranslationDoc(TypedDict, total=False):
+    _id: str
+    conversation_id: str
+    language_code: str
+    translated_content: str
+    message_id: str
+    created_at: str
+    updated_at: str
+
+
+# (second, ISO string) of the most recent default timestamp, shared by all models
+_now_iso_cache = (0, "")
+
+def _intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a dict keyed by a small vocabulary (categories, model ids) with interned keys.
+    
+    Loaded documents then share one string object per key instead of one per
+    document.
+    
+    Args:
+        mapping: Dict with string keys
+        
+    Returns:
+        Dict with the same items and interned keys
+    """
+    intern = sys.intern
+    return {intern(key): value for key, value in mapping.items()}
+
+
+def _now_iso() -> str:
+    """
+    Get the current local time as an ISO 8601 string with second resolution.
+    
+    The formatted string is reused for every call within the same second.
+    
+    Returns:
+        Current timestamp string
+    """
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, cached_iso = _now_iso_cache
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second).isoformat()
+        _now_iso_cache = (second, cached_iso)
+    return cached_iso
+
+
+def _nullable_keys(schema: Dict[str, Any]) -> frozenset:
+    """
+    Get the optional keys of a schema that may hold null.
+    
+    Such keys are left out of to_dict when unset, which from_dict reads back
+    as None.
+    
+    Args:
+        schema: Schema definition
+        
+    Returns:
+        Keys that are not required and accept the null bsonType
+    """
+    required = schema.get("required", ())
+    return frozenset(
+        key for key, prop in schema["properties"].items()
+        if key not in required and "null" in prop.get("bsonType", ())
+    )
+
+
+# A model field: attribute name, MongoDB key, from_dict default, whether
+# to_dict leaves the key out while the value is None and whether from_dict
+# also applies the default to stored nulls
+_FieldSpec = namedtuple("_FieldSpec", "attr key default nullable null_default")
+
+# Field specs of a model with its generated to_dict and from_dict functions
+_CompiledSpec = namedtuple("_CompiledSpec", "fields to_dict from_dict")
+
+# Compiled field specs of each model class, registered after the class definition
+_SPECS: Dict[type, _CompiledSpec] = {}
+
+
+def _compile_spec(
+    schema: Dict[str, Any],
+    fields: Tuple[Tuple[str, Any], ...],
+    null_defaults: Tuple[str, ...] = ()
+) -> _CompiledSpec:
+    """
+    Compile the field table of a model class.
+    
+    Args:
+        schema: Schema of the collection the model is stored in
+        fields: (attribute, from_dict default) pairs in __init__ argument order,
+            starting with the id. Defaults must be literals, so container
+            defaults such as {} are created anew for every object.
+        null_defaults: Attributes whose default from_dict also applies when
+            the stored value is null; other fields keep a stored null
+        
+    Returns:
+        Compiled field spec used by _to_dict and _from_dict
+    """
+    nullable = _nullable_keys(schema)
+    specs = tuple(
+        _FieldSpec(
+            attr, "_id" if attr == "id" else attr, default,
+            attr in nullable, attr in null_defaults
+        )
+        for attr, default in fields
+    )
+    return _CompiledSpec(
+        fields=specs,
+        to_dict=_generate_to_dict(specs),
+        from_dict=_generate_from_dict(specs)
+    )
+
+
+def _generate_to_dict(specs: Tuple[_FieldSpec, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a straight-line to_dict function for a model's field specs.
+    
+    Fields up to the first nullable one are read into a single dict literal.
+    The rest are assigned one by one in field order, skipping nullable fields
+    whose value is None, so the key order of the document is unchanged.
+    
+    Args:
+        specs: Field specs in document key order
+        
+    Returns:
+        Function converting a model object to a MongoDB document
+    """
+    for spec in specs:
+        if not spec.attr.isidentifier():
+            raise ValueError(f"Invalid model attribute name: {spec.attr!r}")
+    
+    leading = 0
+    while leading < len(specs) and not specs[leading].nullable:
+        leading += 1
+    
+    items = ", ".join(f"{spec.key!r}: self.{spec.attr}" for spec in specs[:leading])
+    lines = ["def to_dict(self):", f"    document = {{{items}}}"]
+    for spec in specs[leading:]:
+        if spec.nullable:
+            lines.append(f"    value = self.{spec.attr}")
+            lines.append("    if value is not None:")
+            lines.append(f"        document[{spec.key!r}] = value")
+        else:
+            lines.append(f"    document[{spec.key!r}] = self.{spec.attr}")
+    lines.append("    return document")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["to_dict"]
+
+
+def _generate_from_dict(specs: Tuple[_FieldSpec, ...]) -> Callable[[type, Dict[str, Any]], Any]:
+    """
+    Generate a straight-line from_dict function for a model's field specs.
+    
+    The function reads every key with one data.get call and passes the values
+    to the constructor positionally, so __init__ still applies its defaults.
+    Missing keys get the spec default; stored nulls get it only for fields
+    marked null_default.
+    
+    Args:
+        specs: Field specs in __init__ argument order, starting with the id
+        
+    Returns:
+        Function creating a model object of the given class from a dictionary
+    """
+    lines = [
+        "def from_dict(cls, data):",
+        "    get = data.get",
+        "    id_value = get('_id')",
+        "    if id_value is None:",
+        "        id_value = get('id')"
+    ]
+    arguments = ["id_value"]
+    
+    for index, spec in enumerate(specs[1:], 1):
+        if ast.literal_eval(repr(spec.default)) != spec.default:
+            raise ValueError(f"Default of {spec.attr!r} is not a literal: {spec.default!r}")
+        if spec.default is None:
+            arguments.append(f"get({spec.key!r})")
+            continue
+        if not spec.null_default:
+            arguments.append(f"get({spec.key!r}, {spec.default!r})")
+            continue
+        
+        name = f"value_{index}"
+        lines.append(f"    {name} = get({spec.key!r})")
+        lines.append(f"    if {name} is None:")
+        lines.append(f"        {name} = {spec.default!r}")
+        arguments.append(name)
+    
+    lines.append(f"    return cls({', '.join(arguments)})")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["from_dict"]
+
+
+def _to_dict(obj: Any) -> Any:
+    """
+    Convert a model object to a MongoDB document using its compiled field spec.
+    
+    Args:
+        obj: Model object
+        
+    Returns:
+        Dictionary representation
+    """
+    return _SPECS[type(obj)].to_dict(obj)
+
+
+def _from_dict(cls: type, data: Dict[str, Any]) -> Any:
+    """
+    Create a model object from a dictionary using its compiled field spec.
+    
+    Missing keys fall back to the spec defaults and the id is read from _id or id.
+    
+    Args:
+        cls: Model class
+        data: Dictionary representation
+        
+    Returns:
+        Model object
+    """
+    return _SPECS[cls].from_dict(cls, data)
+
+
+def to_docs(items: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert model objects to MongoDB documents for a single bulk insert.
+    
+    The result is meant for MongoDBBaseClient.insert_many with ordered=False,
+    in batches of about 500 to 1000 documents.
+    
+    Args:
+        items: Model objects
+        
+    Returns:
+        Dictionary representations in the order of items
+    """
+    specs = _SPECS
+    return [specs[type(item)].to_dict(item) for item in items]
+
+
+# Model objects hydrated by from_dict_cached, keyed on (class, id, version timestamp)
+_HYDRATE_CACHE = TTLCache(maxsize=10000, ttl=300)
+
+
+def _from_dict_cached(cls: type, data: Dict[str, Any], version_key: str) -> Any:
+    """
+    Create a model object from a dictionary, reusing a recently built one.
+    
+    Objects are cached on their id and the version_key timestamp, so a newer
+    version of a document is hydrated again. Documents without either are not
+    cached.
+    
+    Args:
+        cls: Model class
+        data: Dictionary representation
+        version_key: Timestamp key that changes whenever the document does
+        
+    Returns:
+        Model object, shared with other callers of the same document version
+    """
+    get = data.get
+    id_value = get("_id")
+    if id_value is None:
+        id_value = get("id")
+    version = get(version_key)
+    if id_value is None or version is None:
+        return _from_dict(cls, data)
+    
+    key = (cls, id_value, version)
+    obj = _HYDRATE_CACHE.get(key)
+    if obj is None:
+        obj = _from_dict(cls, data)
+        _HYDRATE_CACHE.set(key, obj)
+    return obj
+
+
 class ConversationAnalytics:
     """Data model for conversation analytics."""
     
+    __slots__ = (
+        "id", "app_id", "model_provider", "model_id", "mode", "name", "summary",
+        "from_end_user_id", "from_account_id", "status", "created_at", "updated_at",
+        "is_deleted", "message_count", "total_tokens", "total_price", "currency",
+        "system_instruction", "system_instruction_tokens", "analytics_metadata",
+        "messages", "categories"
+    )
+    
     def __init__(
         self,
         id: str,
@@ -498,50 +1070,29 @@ class ConversationAnalytics:
         self.from_end_user_id = from_end_user_id
         self.from_account_id = from_account_id
         self.status = status
-        self.created_at = created_at or datetime.now().isoformat()
-        self.updated_at = updated_at or datetime.now().isoformat()
+        now = None if created_at and updated_at else _now_iso()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
         self.is_deleted = is_deleted
         self.message_count = message_count
         self.total_tokens = total_tokens
         self.total_price = total_price
-        self.currency = currency
+        # Interned so loaded documents share one object per currency
+        self.currency = sys.intern(currency) if type(currency) is str else currency
         self.system_instruction = system_instruction
         self.system_instruction_tokens = system_instruction_tokens
         self.analytics_metadata = analytics_metadata or {}
         self.messages = messages or []
         self.categories = categories or []
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> ConversationAnalyticsDoc:
         """
         Convert to dictionary for MongoDB.
         
         Returns:
             Dictionary representation
         """
-        return {
-            "_id": self.id,
-            "app_id": self.app_id,
-            "model_provider": self.model_provider,
-            "model_id": self.model_id,
-            "mode": self.mode,
-            "name": self.name,
-            "summary": self.summary,
-            "from_end_user_id": self.from_end_user_id,
-            "from_account_id": self.from_account_id,
-            "status": self.status,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "is_deleted": self.is_deleted,
-            "message_count": self.message_count,
-            "total_tokens": self.total_tokens,
-            "total_price": self.total_price,
-            "currency": self.currency,
-            "system_instruction": self.system_instruction,
-            "system_instruction_tokens": self.system_instruction_tokens,
-            "analytics_metadata": self.analytics_metadata,
-            "messages": self.messages,
-            "categories": self.categories
-        }
+        return _to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationAnalytics':
@@ -554,38 +1105,44 @@ class ConversationAnalytics:
         Returns:
             ConversationAnalytics object
         """
-        # Handle _id vs id
-        id_value = data.get("_id") or data.get("id")
-        
-        return cls(
-            id=id_value,
-            app_id=data.get("app_id"),
-            model_provider=data.get("model_provider"),
-            model_id=data.get("model_id"),
-            mode=data.get("mode"),
-            name=data.get("name"),
-            summary=data.get("summary"),
-            from_end_user_id=data.get("from_end_user_id"),
-            from_account_id=data.get("from_account_id"),
-            status=data.get("status", "active"),
-            created_at=data.get("created_at"),
-            updated_at=data.get("updated_at"),
-            is_deleted=data.get("is_deleted", False),
-            message_count=data.get("message_count", 0),
-            total_tokens=data.get("total_tokens", 0),
-            total_price=data.get("total_price", 0.0),
-            currency=data.get("currency", "USD"),
-            system_instruction=data.get("system_instruction"),
-            system_instruction_tokens=data.get("system_instruction_tokens", 0),
-            analytics_metadata=data.get("analytics_metadata", {}),
-            messages=data.get("messages", []),
-            categories=data.get("categories", [])
-        )
+        return _from_dict(cls, data)
+    
+    @classmethod
+    def from_dict_cached(cls, data: Dict[str, Any]) -> 'ConversationAnalytics':
+        """
+        Create from dictionary, reusing the object built for the same document.
+        
+        Documents are versioned by updated_at. The returned object may be shared
+        with other callers and must not be modified.
+        
+        Args:
+            data: Dictionary representation
+            
+        Returns:
+            ConversationAnalytics object
+        """
+        return _from_dict_cached(cls, data, "updated_at")
+
+
+_SPECS[ConversationAnalytics] = _compile_spec(CONVERSATION_ANALYTICS_SCHEMA, (
+    ("id", None), ("app_id", None), ("model_provider", None), ("model_id", None),
+    ("mode", None), ("name", None), ("summary", None), ("from_end_user_id", None),
+    ("from_account_id", None), ("status", "active"), ("created_at", None),
+    ("updated_at", None), ("is_deleted", False), ("message_count", 0),
+    ("total_tokens", 0), ("total_price", 0.0), ("currency", "USD"),
+    ("system_instruction", None), ("system_instruction_tokens", 0),
+    ("analytics_metadata", None), ("messages", None), ("categories", None)
+))
 
 
 class ConversationMessage:
     """Data model for conversation messages."""
     
+    __slots__ = (
+        "id", "conversation_id", "sequence_number", "role", "content", "tokens",
+        "price", "currency", "created_at", "model_id", "parent_message_id", "metadata"
+    )
+    
     def __init__(
         self,
         id: str,
@@ -625,33 +1182,21 @@ class ConversationMessage:
         self.content = content
         self.tokens = tokens
         self.price = price
-        self.currency = currency
-        self.created_at = created_at or datetime.now().isoformat()
+        # Interned so loaded documents share one object per currency
+        self.currency = sys.intern(currency) if type(currency) is str else currency
+        self.created_at = created_at or _now_iso()
         self.model_id = model_id
         self.parent_message_id = parent_message_id
         self.metadata = metadata or {}
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> ConversationMessageDoc:
         """
         Convert to dictionary for MongoDB.
         
         Returns:
             Dictionary representation
         """
-        return {
-            "_id": self.id,
-            "conversation_id": self.conversation_id,
-            "sequence_number": self.sequence_number,
-            "role": self.role,
-            "content": self.content,
-            "tokens": self.tokens,
-            "price": self.price,
-            "currency": self.currency,
-            "created_at": self.created_at,
-            "model_id": self.model_id,
-            "parent_message_id": self.parent_message_id,
-            "metadata": self.metadata
-        }
+        return _to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationMessage':
@@ -664,28 +1209,41 @@ class ConversationMessage:
         Returns:
             ConversationMessage object
         """
-        # Handle _id vs id
-        id_value = data.get("_id") or data.get("id")
-        
-        return cls(
-            id=id_value,
-            conversation_id=data.get("conversation_id"),
-            sequence_number=data.get("sequence_number"),
-            role=data.get("role"),
-            content=data.get("content", ""),
-            tokens=data.get("tokens", 0),
-            price=data.get("price", 0.0),
-            currency=data.get("currency", "USD"),
-            created_at=data.get("created_at"),
-            model_id=data.get("model_id"),
-            parent_message_id=data.get("parent_message_id"),
-            metadata=data.get("metadata", {})
-        )
+        return _from_dict(cls, data)
+    
+    @classmethod
+    def from_dict_cached(cls, data: Dict[str, Any]) -> 'ConversationMessage':
+        """
+        Create from dictionary, reusing the object built for the same document.
+        
+        Messages are not updated, so created_at versions them. The returned
+        object may be shared with other callers and must not be modified.
+        
+        Args:
+            data: Dictionary representation
+            
+        Returns:
+            ConversationMessage object
+        """
+        return _from_dict_cached(cls, data, "created_at")
+
+
+_SPECS[ConversationMessage] = _compile_spec(CONVERSATION_MESSAGES_SCHEMA, (
+    ("id", None), ("conversation_id", None), ("sequence_number", None), ("role", None),
+    ("content", ""), ("tokens", 0), ("price", 0.0), ("currency", "USD"),
+    ("created_at", None), ("model_id", None), ("parent_message_id", None),
+    ("metadata", None)
+))
 
 
 class ConversationCategory:
     """Data model for conversation categories."""
     
+    __slots__ = (
+        "id", "conversation_id", "category_type", "category_value", "confidence_score",
+        "created_at", "created_by"
+    )
+    
     def __init__(
         self,
         id: str,
@@ -713,25 +1271,17 @@ class ConversationCategory:
         self.category_type = category_type
         self.category_value = category_value
         self.confidence_score = confidence_score
-        self.created_at = created_at or datetime.now().isoformat()
+        self.created_at = created_at or _now_iso()
         self.created_by = created_by
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> ConversationCategoryDoc:
         """
         Convert to dictionary for MongoDB.
         
         Returns:
             Dictionary representation
         """
-        return {
-            "_id": self.id,
-            "conversation_id": self.conversation_id,
-            "category_type": self.category_type,
-            "category_value": self.category_value,
-            "confidence_score": self.confidence_score,
-            "created_at": self.created_at,
-            "created_by": self.created_by
-        }
+        return _to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationCategory':
@@ -744,23 +1294,24 @@ class ConversationCategory:
         Returns:
             ConversationCategory object
         """
-        # Handle _id vs id
-        id_value = data.get("_id") or data.get("id")
-        
-        return cls(
-            id=id_value,
-            conversation_id=data.get("conversation_id"),
-            category_type=data.get("category_type"),
-            category_value=data.get("category_value"),
-            confidence_score=data.get("confidence_score", 1.0),
-            created_at=data.get("created_at"),
-            created_by=data.get("created_by", "system")
-        )
+        return _from_dict(cls, data)
+
+
+_SPECS[ConversationCategory] = _compile_spec(CONVERSATION_CATEGORIES_SCHEMA, (
+    ("id", None), ("conversation_id", None), ("category_type", None),
+    ("category_value", None), ("confidence_score", 1.0), ("created_at", None),
+    ("created_by", "system")
+))
 
 
 class ConversationTranslation:
     """Data model for conversation translations."""
     
+    __slots__ = (
+        "id", "conversation_id", "language_code", "translated_content", "message_id",
+        "created_at", "updated_at"
+    )
+    
     def __init__(
         self,
         id: str,
@@ -788,25 +1339,18 @@ class ConversationTranslation:
         self.language_code = language_code
         self.translated_content = translated_content
         self.message_id = message_id
-        self.created_at = created_at or datetime.now().isoformat()
-        self.updated_at = updated_at or datetime.now().isoformat()
+        now = None if created_at and updated_at else _now_iso()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> ConversationTranslationDoc:
         """
         Convert to dictionary for MongoDB.
         
         Returns:
             Dictionary representation
         """
-        return {
-            "_id": self.id,
-            "conversation_id": self.conversation_id,
-            "language_code": self.language_code,
-            "translated_content": self.translated_content,
-            "message_id": self.message_id,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at
-        }
+        return _to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationTranslation':
@@ -819,23 +1363,21 @@ class ConversationTranslation:
         Returns:
             ConversationTranslation object
         """
-        # Handle _id vs id
-        id_value = data.get("_id") or data.get("id")
-        
-        return cls(
-            id=id_value,
-            conversation_id=data.get("conversation_id"),
-            language_code=data.get("language_code"),
-            translated_content=data.get("translated_content", ""),
-            message_id=data.get("message_id"),
-            created_at=data.get("created_at"),
-            updated_at=data.get("updated_at")
-        )
+        return _from_dict(cls, data)
+
+
+_SPECS[ConversationTranslation] = _compile_spec(CONVERSATION_TRANSLATIONS_SCHEMA, (
+    ("id", None), ("conversation_id", None), ("language_code", None),
+    ("translated_content", ""), ("message_id", None), ("created_at", None),
+    ("updated_at", None)
+))
 
 
 class AnalyticsReport:
     """Data model for analytics reports."""
     
+    __slots__ = ("id", "report_type", "period_start", "period_end", "report_data", "created_at")
+    
     def __init__(
         self,
         id: str,
@@ -857,11 +1399,11 @@ class AnalyticsReport:
             created_at: Timestamp when the report was created
         """
         self.id = id
-        self.report_type = report_type
+        self.report_type = sys.intern(report_type) if type(report_type) is str else report_type
         self.period_start = period_start
         self.period_end = period_end
         self.report_data = report_data
-        self.created_at = created_at or datetime.now().isoformat()
+        self.created_at = created_at or _now_iso()
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -870,14 +1412,7 @@ class AnalyticsReport:
         Returns:
             Dictionary representation
         """
-        return {
-            "_id": self.id,
-            "report_type": self.report_type,
-            "period_start": self.period_start,
-            "period_end": self.period_end,
-            "report_data": self.report_data,
-            "created_at": self.created_at
-        }
+        return _to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AnalyticsReport':
@@ -890,22 +1425,77 @@ class AnalyticsReport:
         Returns:
             AnalyticsReport object
         """
-        # Handle _id vs id
-        id_value = data.get("_id") or data.get("id")
+        return _from_dict(cls, data)
+    
+    def __eq__(self, other: Any) -> bool:
+        """Objects are equal when they are of the same model and share an id."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        return hash(self.id)
+    
+    @classmethod
+    def from_many(cls, docs: Iterable[Dict[str, Any]]) -> List['AnalyticsReport']:
+        """
+        Create objects from a batch of dictionaries, such as a cursor page.
         
-        return cls(
-            id=id_value,
-            report_type=data.get("report_type"),
-            period_start=data.get("period_start"),
-            period_end=data.get("period_end"),
-            report_data=data.get("report_data", {}),
-            created_at=data.get("created_at")
-        )
+        Fields are assigned directly instead of going through __init__.
+        
+        Args:
+            docs: Dictionary representations
+            
+        Returns:
+            AnalyticsReport objects in the order of docs
+        """
+        new = cls.__new__
+        reports = []
+        
+        for data in docs:
+            get = data.get
+            report = new(cls)
+            id_value = get("_id")
+            report.id = get("id") if id_value is None else id_value
+            report_type = get("report_type")
+            report.report_type = (
+                sys.intern(report_type) if type(report_type) is str else report_type
+            )
+            report.period_start = get("period_start")
+            report.period_end = get("period_end")
+            report.report_data = get("report_data", {})
+            report.created_at = get("created_at") or _now_iso()
+            reports.append(report)
+        
+        return reports
+
+
+_SPECS[AnalyticsReport] = _compile_spec(ANALYTICS_REPORTS_SCHEMA, (
+    ("id", None), ("report_type", None), ("period_start", None), ("period_end", None),
+    ("report_data", {}), ("created_at", None)
+))
+
+
+# Counter attributes packed by UserAnalytics.batch_to_array and their NumPy types
+_USER_COUNTER_FIELDS = (
+    ("total_conversations", "i8"),
+    ("total_messages", "i8"),
+    ("total_tokens", "i8"),
+    ("total_price", "f8")
+)
+_USER_COUNTERS = attrgetter(*[name for name, _ in _USER_COUNTER_FIELDS])
 
 
 class UserAnalytics:
     """Data model for user analytics."""
     
+    __slots__ = (
+        "id", "updated_at", "total_conversations", "total_messages", "total_tokens",
+        "total_price", "first_conversation_at", "last_conversation_at", "daily_metrics",
+        "_category_distribution", "_raw_category_distribution", "_model_usage",
+        "_raw_model_usage"
+    )
+    
     def __init__(
         self,
         id: str,
@@ -937,16 +1527,50 @@ class UserAnalytics:
             model_usage: Usage by model
         """
         self.id = id
-        self.updated_at = updated_at or datetime.now().isoformat()
+        self.updated_at = updated_at or _now_iso()
         self.total_conversations = total_conversations
         self.total_messages = total_messages
         self.total_tokens = total_tokens
         self.total_price = total_price
         self.first_conversation_at = first_conversation_at
         self.last_conversation_at = last_conversation_at
-        self.daily_metrics = daily_metrics or {}
-        self.category_distribution = category_distribution or {}
-        self.model_usage = model_usage or {}
+        self.daily_metrics = daily_metrics if daily_metrics is not None else {}
+        
+        # Copied with interned keys on first access, see the properties below
+        self._category_distribution = None
+        self._raw_category_distribution = category_distribution
+        self._model_usage = None
+        self._raw_model_usage = model_usage
+    
+    @property
+    def category_distribution(self) -> Dict[str, int]:
+        """Distribution of categories, materialized on first access."""
+        value = self._category_distribution
+        if value is None:
+            raw = self._raw_category_distribution
+            value = self._category_distribution = _intern_keys(raw) if raw else {}
+            self._raw_category_distribution = None
+        return value
+    
+    @category_distribution.setter
+    def category_distribution(self, value: Dict[str, int]) -> None:
+        self._category_distribution = value
+        self._raw_category_distribution = None
+    
+    @property
+    def model_usage(self) -> Dict[str, Dict[str, Any]]:
+        """Usage by model, materialized on first access."""
+        value = self._model_usage
+        if value is None:
+            raw = self._raw_model_usage
+            value = self._model_usage = _intern_keys(raw) if raw else {}
+            self._raw_model_usage = None
+        return value
+    
+    @model_usage.setter
+    def model_usage(self, value: Dict[str, Dict[str, Any]]) -> None:
+        self._model_usage = value
+        self._raw_model_usage = None
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -955,19 +1579,7 @@ class UserAnalytics:
         Returns:
             Dictionary representation
         """
-        return {
-            "_id": self.id,
-            "updated_at": self.updated_at,
-            "total_conversations": self.total_conversations,
-            "total_messages": self.total_messages,
-            "total_tokens": self.total_tokens,
-            "total_price": self.total_price,
-            "first_conversation_at": self.first_conversation_at,
-            "last_conversation_at": self.last_conversation_at,
-            "daily_metrics": self.daily_metrics,
-            "category_distribution": self.category_distribution,
-            "model_usage": self.model_usage
-        }
+        return _to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserAnalytics':
@@ -980,19 +1592,86 @@ class UserAnalytics:
         Returns:
             UserAnalytics object
         """
-        # Handle _id vs id
-        id_value = data.get("_id") or data.get("id")
-        
-        return cls(
-            id=id_value,
-            updated_at=data.get("updated_at"),
-            total_conversations=data.get("total_conversations", 0),
-            total_messages=data.get("total_messages", 0),
-            total_tokens=data.get("total_tokens", 0),
-            total_price=data.get("total_price", 0.0),
-            first_conversation_at=data.get("first_conversation_at"),
-            last_conversation_at=data.get("last_conversation_at"),
-            daily_metrics=data.get("daily_metrics", {}),
-            category_distribution=data.get("category_distribution", {}),
-            model_usage=data.get("model_usage", {})
-        )
\ No newline at end of file
+        return _from_dict(cls, data)
+    
+    def __eq__(self, other: Any) -> bool:
+        """Objects are equal when they are of the same model and share an id."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        return hash(self.id)
+    
+    @classmethod
+    def from_many(cls, docs: Iterable[Dict[str, Any]]) -> List['UserAnalytics']:
+        """
+        Create objects from a batch of dictionaries, such as a cursor page.
+        
+        Fields are assigned directly instead of going through __init__.
+        
+        Args:
+            docs: Dictionary representations
+            
+        Returns:
+            UserAnalytics objects in the order of docs
+        """
+        new = cls.__new__
+        users = []
+        
+        for data in docs:
+            get = data.get
+            user = new(cls)
+            id_value = get("_id")
+            user.id = get("id") if id_value is None else id_value
+            user.updated_at = get("updated_at") or _now_iso()
+            total_conversations = get("total_conversations")
+            user.total_conversations = 0 if total_conversations is None else total_conversations
+            total_messages = get("total_messages")
+            user.total_messages = 0 if total_messages is None else total_messages
+            total_tokens = get("total_tokens")
+            user.total_tokens = 0 if total_tokens is None else total_tokens
+            total_price = get("total_price")
+            user.total_price = 0.0 if total_price is None else total_price
+            user.first_conversation_at = get("first_conversation_at")
+            user.last_conversation_at = get("last_conversation_at")
+            user.daily_metrics = get("daily_metrics") or {}
+            user._category_distribution = None
+            user._raw_category_distribution = get("category_distribution")
+            user._model_usage = None
+            user._raw_model_usage = get("model_usage")
+            users.append(user)
+        
+        return users
+    
+    @classmethod
+    def batch_to_array(cls, users: Sequence['UserAnalytics']) -> 'np.ndarray':
+        """
+        Pack the counters of many users into one NumPy structured array.
+        
+        Aggregations such as array["total_tokens"].sum() then run in NumPy
+        instead of looping over the objects.
+        
+        Args:
+            users: UserAnalytics objects
+            
+        Returns:
+            Structured array with total_conversations, total_messages,
+            total_tokens and total_price columns, one row per user
+        """
+        import numpy as np
+        
+        counters = _USER_COUNTERS
+        return np.fromiter(
+            (counters(user) for user in users),
+            dtype=np.dtype(list(_USER_COUNTER_FIELDS)),
+            count=len(users)
+        )
+
+
+_SPECS[UserAnalytics] = _compile_spec(USER_ANALYTICS_SCHEMA, (
+    ("id", None), ("updated_at", None), ("total_conversations", 0), ("total_messages", 0),
+    ("total_tokens", 0), ("total_price", 0.0), ("first_conversation_at", None),
+    ("last_conversation_at", None), ("daily_metrics", None),
+    ("category_distribution", None), ("model_usage", None)
+), null_defaults=tuple(name for name, _ in _USER_COUNTER_FIELDS))
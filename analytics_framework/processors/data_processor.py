@@ -1,13 +1,243 @@
 """Process and transform data from NocoDB to MongoDB format."""
 
 import logging
-from datetime import datetime
-from typing import Dict, List, Any
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
 import re
 import json
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from ..utils import json_utils
 from ..utils.thread_pool import thread_pool_manager
 
+# NocoDB columns read by process_conversation_with_messages
+CONVERSATION_FIELDS = ",".join([
+    "id", "app_id", "model_provider", "model_id", "mode", "name", "summary",
+    "from_end_user_id", "from_account_id", "status", "created_at", "updated_at",
+    "is_deleted", "system_instruction", "system_instruction_tokens", "inputs"
+])
+MESSAGE_FIELDS = ",".join([
+    "id", "conversation_id", "role", "query", "answer", "message_tokens",
+    "answer_tokens", "total_price", "currency", "created_at", "model_id",
+    "parent_message_id", "message_metadata", "system_instruction"
+])
+# Conversation fields read by the category extractors
+CATEGORY_CONTEXT_FIELDS = ("id", "name")
+
+# Topic keywords as (topic, primary keywords, secondary keywords, weight)
+_TOPIC_KEYWORDS = (
+    ("pricing",
+     ("price", "cost", "pricing", "payment", "subscription", "billing", "fee"),
+     ("discount", "plan", "trial", "free", "premium", "upgrade", "downgrade", "charge"),
+     1.0),
+    ("technical_issue",
+     ("error", "bug", "issue", "problem", "crash", "not working", "broken", "fail"),
+     ("fix", "resolve", "solution", "troubleshoot", "debug", "repair", "malfunction", "glitch"),
+     1.0),
+    ("feature_request",
+     ("feature", "add", "implement", "enhancement", "improve", "suggestion"),
+     ("functionality", "capability", "option", "ability", "support for", "integration"),
+     0.9),
+    ("account",
+     ("account", "login", "password", "sign in", "sign up", "register", "profile"),
+     ("username", "email", "authentication", "credentials", "forgot", "reset", "verification"),
+     0.9),
+    ("general_inquiry",
+     ("how to", "what is", "explain", "help", "guide", "tutorial", "documentation"),
+     ("instructions", "steps", "process", "procedure", "information", "details", "clarify"),
+     0.8),
+    ("feedback",
+     ("feedback", "review", "opinion", "think", "suggest", "recommendation"),
+     ("impression", "experience", "satisfaction", "dissatisfaction", "rating", "evaluation"),
+     0.8),
+    ("data_privacy",
+     ("privacy", "data", "gdpr", "ccpa", "personal information", "consent", "opt-out"),
+     ("collect", "store", "share", "delete", "retention", "policy", "compliance"),
+     1.0),
+    ("integration",
+     ("integrate", "integration", "connect", "api", "webhook", "sync", "import", "export"),
+     ("third-party", "platform", "service", "tool", "compatibility", "connection"),
+     0.9),
+)
+
+# Intent patterns as (intent, compiled patterns, start pattern, weight), compiled
+# once at import. The start pattern joins an intent's patterns into one
+# alternation, so checking whether any of them matches at the beginning of
+# the text is a single match call.
+_INTENT_PATTERNS = tuple(
+    (
+        intent,
+        tuple(re.compile(pattern) for pattern in patterns),
+        re.compile("|".join(f"(?:{pattern})" for pattern in patterns)),
+        weight
+    )
+    for intent, patterns, weight in (
+        ("question", (
+            r"\?$",
+            r"^(what|how|why|when|where|who|can|could|would|will|is|are|do|does|did)",
+            r"(tell me|explain|describe|elaborate on|clarify)"
+        ), 1.0),
+        ("request", (
+            r"^(please|can you|could you|would you|will you|i need|i want|i would like|i'd like)",
+            r"(help me|assist me|support me|guide me)",
+            r"(create|update|delete|modify|change|add|remove)"
+        ), 0.9),
+        ("complaint", (
+            r"(not working|doesn't work|isn't working|broken|issue|problem|bug|error|crash)",
+            r"(disappointed|unhappy|frustrated|annoyed|upset|dissatisfied)",
+            r"(failed|failure|poor|bad|terrible|awful|horrible)"
+        ), 1.0),
+        ("feedback", (
+            r"(feedback|review|opinion|think|suggest|improve|enhancement)",
+            r"(like|love|enjoy|appreciate|prefer)",
+            r"(don't like|dislike|hate|not a fan)"
+        ), 0.9),
+        ("greeting", (
+            r"^(hi|hello|hey|greetings|good morning|good afternoon|good evening)",
+            r"(nice to meet you|pleasure to meet you)"
+        ), 0.7),
+        ("gratitude", (
+            r"(thank|thanks|appreciate|grateful|much appreciated)",
+            r"(you've been helpful|you're the best|excellent service)"
+        ), 0.8),
+        ("farewell", (
+            r"(bye|goodbye|see you|talk to you later|until next time)",
+            r"(have a good day|have a nice day|have a great day)"
+        ), 0.7),
+        ("troubleshooting", (
+            r"(troubleshoot|diagnose|debug|fix|resolve|solve)",
+            r"(steps to|how to fix|how to resolve|how to solve)",
+            r"(tried|attempted|not working after)"
+        ), 1.0),
+        ("purchase_intent", (
+            r"(buy|purchase|subscribe|order|get|acquire)",
+            r"(how much|price|cost|fee|subscription|payment)",
+            r"(discount|offer|deal|promotion|coupon)"
+        ), 1.0),
+    )
+)
+
+# Sentiment terms as (weight, terms) from strong (3.0) to weak (1.0)
+_POSITIVE_TERMS = (
+    (3.0, (
+        "excellent", "amazing", "awesome", "fantastic", "outstanding",
+        "exceptional", "wonderful", "brilliant", "superb", "perfect",
+        "love", "delighted", "thrilled", "impressed"
+    )),
+    (2.0, (
+        "good", "great", "happy", "pleased", "satisfied", "like",
+        "helpful", "appreciate", "grateful", "nice", "enjoy",
+        "thank you", "thanks", "positive", "well done", "effective"
+    )),
+    (1.0, (
+        "ok", "okay", "fine", "alright", "decent", "acceptable",
+        "adequate", "satisfactory", "sufficient", "reasonable"
+    )),
+)
+_NEGATIVE_TERMS = (
+    (3.0, (
+        "terrible", "awful", "horrible", "dreadful", "abysmal",
+        "hate", "furious", "outraged", "disgusted", "appalled",
+        "unacceptable", "useless", "pathetic", "disaster"
+    )),
+    (2.0, (
+        "bad", "poor", "disappointing", "frustrated", "angry",
+        "unhappy", "dissatisfied", "dislike", "annoyed", "irritated",
+        "problem", "issue", "error", "bug", "crash", "not working", "broken"
+    )),
+    (1.0, (
+        "not great", "could be better", "mediocre", "subpar",
+        "underwhelming", "lacking", "insufficient", "not ideal"
+    )),
+)
+
+# Negation words that can flip sentiment
+_NEGATION_WORDS = frozenset((
+    "not", "no", "never", "neither", "nor", "none", "nothing",
+    "nowhere", "hardly", "barely", "scarcely", "doesn't", "don't",
+    "didn't", "isn't", "aren't", "wasn't", "weren't", "hasn't",
+    "haven't", "hadn't", "won't", "wouldn't", "can't", "cannot",
+    "couldn't", "shouldn't"
+))
+
+# Intensifiers that strengthen sentiment
+_INTENSIFIERS = frozenset((
+    "very", "really", "extremely", "incredibly", "absolutely",
+    "completely", "totally", "utterly", "highly", "especially",
+    "particularly", "exceptionally", "remarkably", "decidedly",
+    "exceedingly", "immensely", "thoroughly", "entirely", "fully"
+))
+
+_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+
+_TOPIC_KEYWORD_SET = frozenset(
+    keyword for _, primary, secondary, _ in _TOPIC_KEYWORDS for keyword in primary + secondary
+)
+_SENTIMENT_KEYWORD_SET = frozenset(
+    term for _, terms in _POSITIVE_TERMS + _NEGATIVE_TERMS for term in terms
+)
+
+
+def _build_keyword_automaton() -> Any:
+    """
+    Build an Aho-Corasick automaton over every topic and sentiment keyword.
+    
+    Returns:
+        pyahocorasick Automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in _TOPIC_KEYWORD_SET | _SENTIMENT_KEYWORD_SET:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _count_keywords(text: str, keywords: frozenset) -> Dict[str, int]:
+    """
+    Count non-overlapping occurrences of keywords in text, like str.count.
+    
+    With pyahocorasick installed every known keyword is counted in a single
+    pass over the text; otherwise each keyword in keywords is counted with
+    str.count.
+    
+    Args:
+        text: Lowercased text to scan
+        keywords: Keywords the caller reads from the result
+        
+    Returns:
+        Dictionary mapping keywords found in text to their counts
+    """
+    counts = {}
+    
+    if _KEYWORD_AUTOMATON is None:
+        for keyword in keywords:
+            count = text.count(keyword)
+            if count:
+                counts[keyword] = count
+        return counts
+    
+    # Matches arrive ordered by end position; skip a keyword's matches that
+    # overlap its previous one so counts agree with str.count
+    next_start = {}
+    for end, keyword in _KEYWORD_AUTOMATON.iter(text):
+        start = end - len(keyword) + 1
+        if start < next_start.get(keyword, 0):
+            continue
+        next_start[keyword] = end + 1
+        counts[keyword] = counts.get(keyword, 0) + 1
+    
+    return counts
+
 
 class DataProcessor:
     """Process and transform data from NocoDB to MongoDB format."""
@@ -31,7 +261,7 @@ class DataProcessor:
             return {} if json_str == '{}' else []
             
         try:
-            return json.loads(json_str)
+            return json_utils.loads(json_str)
         except json.JSONDecodeError as e:
             self.logger.warning(f"Failed to parse JSON in {field_name}: {str(e)}")
             return {} if json_str.strip().startswith('{') else []
@@ -54,17 +284,46 @@ class DataProcessor:
         Returns:
             List of processed conversation documents
         """
-        # Use thread pool to process conversations in parallel
-        return thread_pool_manager.map_processing(
-            self.process_conversation_with_messages,
-            conversations,
-            messages_by_conversation
+        # Ship each conversation with only its own messages so process
+        # workers don't unpickle the whole message map per task
+        items = [
+            (conversation, messages_by_conversation.get(conversation.get('id'), []))
+            for conversation in conversations
+        ]
+        
+        # Stamp the whole batch with one processed_at timestamp
+        now_iso = datetime.now().isoformat()
+        
+        # Use the process pool; this is pure-Python CPU work bound by the GIL
+        return thread_pool_manager.map_process(self._process_conversation_item, items, now_iso)
+    
+    def _process_conversation_item(
+        self,
+        item: Tuple[Dict[str, Any], List[Dict[str, Any]]],
+        now_iso: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a (conversation, messages) pair from process_conversations_batch.
+        
+        Args:
+            item: Tuple of conversation data and its messages
+            now_iso: ISO timestamp for processed_at
+            
+        Returns:
+            Processed conversation document
+        """
+        conversation, messages = item
+        return self.process_conversation_with_messages(
+            conversation,
+            {conversation.get('id'): messages},
+            now_iso
         )
     
     def process_conversation_with_messages(
         self,
         conversation: Dict[str, Any],
-        messages_by_conversation: Dict[str, List[Dict[str, Any]]]
+        messages_by_conversation: Dict[str, List[Dict[str, Any]]],
+        now_iso: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a conversation with its messages.
@@ -72,6 +331,7 @@ class DataProcessor:
         Args:
             conversation: Conversation data
             messages_by_conversation: Dictionary mapping conversation IDs to messages
+            now_iso: ISO timestamp for processed_at; defaults to the current time
             
         Returns:
             Processed conversation document
@@ -82,37 +342,44 @@ class DataProcessor:
         # Sort messages by creation time or sequence
         sorted_messages = sorted(messages, key=lambda m: m.get('created_at', ''))
         
-        # Calculate analytics metrics
+        # Calculate analytics metrics while building the embedded messages
         message_count = len(messages)
-        total_tokens = sum(m.get('message_tokens', 0) + m.get('answer_tokens', 0) for m in messages)
-        total_price = sum(m.get('total_price', 0) for m in messages)
+        total_tokens = 0
+        total_price = 0
         
         # Process messages into embedded format
         processed_messages = []
         for i, msg in enumerate(sorted_messages):
-            processed_message = {
+            is_query = i % 2 == 0
+            message_tokens = msg.get('message_tokens', 0)
+            answer_tokens = msg.get('answer_tokens', 0)
+            price = msg.get('total_price', 0)
+            
+            total_tokens += message_tokens + answer_tokens
+            total_price += price
+            
+            # Ensure metadata is a dictionary
+            metadata = msg.get('message_metadata', {})
+            if isinstance(metadata, str):
+                try:
+                    metadata = self._parse_json_field(metadata, 'message_metadata')
+                except Exception:
+                    metadata = {}
+            elif metadata is None:
+                metadata = {}
+            
+            processed_messages.append({
                 "message_id": msg.get('id'),
                 "sequence_number": i + 1,
                 "role": self._determine_message_role(msg, i),
-                "content": msg.get('query') if i % 2 == 0 else msg.get('answer'),
-                "tokens": msg.get('message_tokens', 0) if i % 2 == 0 else msg.get('answer_tokens', 0),
-                "price": msg.get('total_price', 0),
+                "content": msg.get('query') if is_query else msg.get('answer'),
+                "tokens": message_tokens if is_query else answer_tokens,
+                "price": price,
                 "created_at": msg.get('created_at'),
                 "model_id": msg.get('model_id'),
                 "parent_message_id": msg.get('parent_message_id'),
-                "metadata": msg.get('message_metadata', {})
-            }
-            
-            # Ensure metadata is a dictionary
-            if isinstance(processed_message["metadata"], str):
-                try:
-                    processed_message["metadata"] = self._parse_json_field(processed_message["metadata"], 'message_metadata')
-                except Exception:
-                    processed_message["metadata"] = {}
-            elif processed_message["metadata"] is None:
-                processed_message["metadata"] = {}
-                
-            processed_messages.append(processed_message)
+                "metadata": metadata
+            })
             
         # Parse JSON inputs
         inputs = conversation.get('inputs', '{}')
@@ -159,7 +426,7 @@ class DataProcessor:
             
             # Analytics metadata
             "analytics_metadata": {
-                "processed_at": datetime.now().isoformat()
+                "processed_at": now_iso or datetime.now().isoformat()
             },
             
             # Parsed inputs
@@ -206,29 +473,31 @@ class DataProcessor:
             List of category objects
         """
         categories = []
+        now_iso = datetime.now().isoformat()
         
         # Extract user messages for analysis
         user_messages = [msg for msg in messages if self._determine_message_role(msg, 0) == 'user']
         user_content = " ".join([msg.get('query', '') for msg in user_messages])
         
         # Topic categorization
-        topic_categories = self._extract_topic_categories(user_content, conversation)
+        topic_categories = self._extract_topic_categories(user_content, conversation, now_iso)
         categories.extend(topic_categories)
         
         # Intent categorization
-        intent_categories = self._extract_intent_categories(user_content, conversation)
+        intent_categories = self._extract_intent_categories(user_content, conversation, now_iso)
         categories.extend(intent_categories)
         
         # Sentiment analysis
-        sentiment_categories = self._analyze_sentiment(user_content, conversation)
+        sentiment_categories = self._analyze_sentiment(user_content, conversation, now_iso)
         categories.extend(sentiment_categories)
         
         return categories
     
+    @staticmethod
     def _extract_topic_categories(
-        self,
         content: str,
-        conversation: Dict[str, Any]
+        conversation: Dict[str, Any],
+        now_iso: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract topic categories from content.
@@ -236,75 +505,32 @@ class DataProcessor:
         Args:
             content: Text content to analyze
             conversation: Conversation data
+            now_iso: ISO timestamp for created_at; defaults to the current time
             
         Returns:
             List of topic category objects
         """
         categories = []
         content_lower = content.lower()
-        
-        # Define topic keywords with weighted importance
-        topic_keywords = {
-            "pricing": {
-                "primary": ["price", "cost", "pricing", "payment", "subscription", "billing", "fee"],
-                "secondary": ["discount", "plan", "trial", "free", "premium", "upgrade", "downgrade", "charge"],
-                "weight": 1.0
-            },
-            "technical_issue": {
-                "primary": ["error", "bug", "issue", "problem", "crash", "not working", "broken", "fail"],
-                "secondary": ["fix", "resolve", "solution", "troubleshoot", "debug", "repair", "malfunction", "glitch"],
-                "weight": 1.0
-            },
-            "feature_request": {
-                "primary": ["feature", "add", "implement", "enhancement", "improve", "suggestion"],
-                "secondary": ["functionality", "capability", "option", "ability", "support for", "integration"],
-                "weight": 0.9
-            },
-            "account": {
-                "primary": ["account", "login", "password", "sign in", "sign up", "register", "profile"],
-                "secondary": ["username", "email", "authentication", "credentials", "forgot", "reset", "verification"],
-                "weight": 0.9
-            },
-            "general_inquiry": {
-                "primary": ["how to", "what is", "explain", "help", "guide", "tutorial", "documentation"],
-                "secondary": ["instructions", "steps", "process", "procedure", "information", "details", "clarify"],
-                "weight": 0.8
-            },
-            "feedback": {
-                "primary": ["feedback", "review", "opinion", "think", "suggest", "recommendation"],
-                "secondary": ["impression", "experience", "satisfaction", "dissatisfaction", "rating", "evaluation"],
-                "weight": 0.8
-            },
-            "data_privacy": {
-                "primary": ["privacy", "data", "gdpr", "ccpa", "personal information", "consent", "opt-out"],
-                "secondary": ["collect", "store", "share", "delete", "retention", "policy", "compliance"],
-                "weight": 1.0
-            },
-            "integration": {
-                "primary": ["integrate", "integration", "connect", "api", "webhook", "sync", "import", "export"],
-                "secondary": ["third-party", "platform", "service", "tool", "compatibility", "connection"],
-                "weight": 0.9
-            }
-        }
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
         
         # Context-aware scoring
         topic_scores = {}
+        keyword_counts = _count_keywords(content_lower, _TOPIC_KEYWORD_SET)
         
-        for topic, keyword_data in topic_keywords.items():
+        for topic, primary, secondary, topic_weight in _TOPIC_KEYWORDS:
             # Calculate primary keyword matches (higher weight)
-            primary_matches = [keyword for keyword in keyword_data["primary"] if keyword in content_lower]
-            primary_count = sum(content_lower.count(keyword) for keyword in primary_matches)
+            primary_count = sum(keyword_counts.get(keyword, 0) for keyword in primary)
             
             # Calculate secondary keyword matches (lower weight)
-            secondary_matches = [keyword for keyword in keyword_data["secondary"] if keyword in content_lower]
-            secondary_count = sum(content_lower.count(keyword) for keyword in secondary_matches)
+            secondary_count = sum(keyword_counts.get(keyword, 0) for keyword in secondary)
             
             # Calculate weighted score
-            topic_weight = keyword_data["weight"]
             score = (primary_count * 0.7 + secondary_count * 0.3) * topic_weight
             
             # Consider context from conversation metadata
-            if conversation.get("name") and any(keyword in conversation["name"].lower() for keyword in keyword_data["primary"]):
+            if conversation.get("name") and any(keyword in conversation["name"].lower() for keyword in primary):
                 score += 0.5
                 
             if score > 0:
@@ -324,16 +550,17 @@ class DataProcessor:
                     "category_type": "topic",
                     "category_value": topic,
                     "confidence_score": confidence,
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": now_iso,
                     "created_by": "system"
                 })
         
         return categories
     
+    @staticmethod
     def _extract_intent_categories(
-        self,
         content: str,
-        conversation: Dict[str, Any]
+        conversation: Dict[str, Any],
+        now_iso: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract intent categories from content.
@@ -341,95 +568,22 @@ class DataProcessor:
         Args:
             content: Text content to analyze
             conversation: Conversation data
+            now_iso: ISO timestamp for created_at; defaults to the current time
             
         Returns:
             List of intent category objects
         """
         categories = []
         content_lower = content.lower()
-        
-        # Define intent patterns with weights
-        intent_patterns = {
-            "question": {
-                "patterns": [
-                    r"\?$", 
-                    r"^(what|how|why|when|where|who|can|could|would|will|is|are|do|does|did)",
-                    r"(tell me|explain|describe|elaborate on|clarify)"
-                ],
-                "weight": 1.0
-            },
-            "request": {
-                "patterns": [
-                    r"^(please|can you|could you|would you|will you|i need|i want|i would like|i'd like)",
-                    r"(help me|assist me|support me|guide me)",
-                    r"(create|update|delete|modify|change|add|remove)"
-                ],
-                "weight": 0.9
-            },
-            "complaint": {
-                "patterns": [
-                    r"(not working|doesn't work|isn't working|broken|issue|problem|bug|error|crash)",
-                    r"(disappointed|unhappy|frustrated|annoyed|upset|dissatisfied)",
-                    r"(failed|failure|poor|bad|terrible|awful|horrible)"
-                ],
-                "weight": 1.0
-            },
-            "feedback": {
-                "patterns": [
-                    r"(feedback|review|opinion|think|suggest|improve|enhancement)",
-                    r"(like|love|enjoy|appreciate|prefer)",
-                    r"(don't like|dislike|hate|not a fan)"
-                ],
-                "weight": 0.9
-            },
-            "greeting": {
-                "patterns": [
-                    r"^(hi|hello|hey|greetings|good morning|good afternoon|good evening)",
-                    r"(nice to meet you|pleasure to meet you)"
-                ],
-                "weight": 0.7
-            },
-            "gratitude": {
-                "patterns": [
-                    r"(thank|thanks|appreciate|grateful|much appreciated)",
-                    r"(you've been helpful|you're the best|excellent service)"
-                ],
-                "weight": 0.8
-            },
-            "farewell": {
-                "patterns": [
-                    r"(bye|goodbye|see you|talk to you later|until next time)",
-                    r"(have a good day|have a nice day|have a great day)"
-                ],
-                "weight": 0.7
-            },
-            "troubleshooting": {
-                "patterns": [
-                    r"(troubleshoot|diagnose|debug|fix|resolve|solve)",
-                    r"(steps to|how to fix|how to resolve|how to solve)",
-                    r"(tried|attempted|not working after)"
-                ],
-                "weight": 1.0
-            },
-            "purchase_intent": {
-                "patterns": [
-                    r"(buy|purchase|subscribe|order|get|acquire)",
-                    r"(how much|price|cost|fee|subscription|payment)",
-                    r"(discount|offer|deal|promotion|coupon)"
-                ],
-                "weight": 1.0
-            }
-        }
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
         
         # Context-aware scoring
         intent_scores = {}
         
-        for intent, data in intent_patterns.items():
-            patterns = data["patterns"]
-            weight = data["weight"]
-            
+        for intent, patterns, start_pattern, weight in _INTENT_PATTERNS:
             # Count pattern matches
-            match_count = sum(1 for pattern in patterns if re.search(pattern, content_lower))
+            match_count = sum(1 for pattern in patterns if pattern.search(content_lower))
             
             # Calculate weighted score
             if match_count > 0:
@@ -441,7 +595,7 @@ class DataProcessor:
                 position_factor = 1.0
                 
                 # Check if any pattern matches at the beginning
-                if any(re.match(pattern, content_lower) for pattern in patterns):
+                if start_pattern.match(content_lower):
                     position_factor = 1.2
                 
                 # Length factor (shorter messages with matches are more focused)
@@ -466,16 +620,17 @@ class DataProcessor:
                     "category_type": "intent",
                     "category_value": intent,
                     "confidence_score": confidence,
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": now_iso,
                     "created_by": "system"
                 })
         
         return categories
     
+    @staticmethod
     def _analyze_sentiment(
-        self,
         content: str,
-        conversation: Dict[str, Any]
+        conversation: Dict[str, Any],
+        now_iso: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Analyze sentiment in content.
@@ -483,96 +638,40 @@ class DataProcessor:
         Args:
             content: Text content to analyze
             conversation: Conversation data
+            now_iso: ISO timestamp for created_at; defaults to the current time
             
         Returns:
             List of sentiment category objects
         """
         content_lower = content.lower()
-        
-        # Define sentiment lexicons with weights
-        sentiment_lexicon = {
-            "positive": {
-                "strong": [
-                    "excellent", "amazing", "awesome", "fantastic", "outstanding",
-                    "exceptional", "wonderful", "brilliant", "superb", "perfect",
-                    "love", "delighted", "thrilled", "impressed"
-                ],
-                "moderate": [
-                    "good", "great", "happy", "pleased", "satisfied", "like",
-                    "helpful", "appreciate", "grateful", "nice", "enjoy",
-                    "thank you", "thanks", "positive", "well done", "effective"
-                ],
-                "weak": [
-                    "ok", "okay", "fine", "alright", "decent", "acceptable",
-                    "adequate", "satisfactory", "sufficient", "reasonable"
-                ]
-            },
-            "negative": {
-                "strong": [
-                    "terrible", "awful", "horrible", "dreadful", "abysmal",
-                    "hate", "furious", "outraged", "disgusted", "appalled",
-                    "unacceptable", "useless", "pathetic", "disaster"
-                ],
-                "moderate": [
-                    "bad", "poor", "disappointing", "frustrated", "angry",
-                    "unhappy", "dissatisfied", "dislike", "annoyed", "irritated",
-                    "problem", "issue", "error", "bug", "crash", "not working", "broken"
-                ],
-                "weak": [
-                    "not great", "could be better", "mediocre", "subpar",
-                    "underwhelming", "lacking", "insufficient", "not ideal"
-                ]
-            }
-        }
-        
-        # Negation words that can flip sentiment
-        negation_words = [
-            "not", "no", "never", "neither", "nor", "none", "nothing",
-            "nowhere", "hardly", "barely", "scarcely", "doesn't", "don't",
-            "didn't", "isn't", "aren't", "wasn't", "weren't", "hasn't",
-            "haven't", "hadn't", "won't", "wouldn't", "can't", "cannot",
-            "couldn't", "shouldn't"
-        ]
-        
-        # Intensifiers that strengthen sentiment
-        intensifiers = [
-            "very", "really", "extremely", "incredibly", "absolutely",
-            "completely", "totally", "utterly", "highly", "especially",
-            "particularly", "exceptionally", "remarkably", "decidedly",
-            "exceedingly", "immensely", "thoroughly", "entirely", "fully"
-        ]
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
         
         # Calculate sentiment scores with context awareness
         positive_score = 0
         negative_score = 0
         
         # Split content into sentences for more accurate negation handling
-        sentences = re.split(r'[.!?]+', content_lower)
+        sentences = _SENTENCE_SPLIT.split(content_lower)
         
         for sentence in sentences:
             words = sentence.split()
             
             # Check for negation in this sentence
-            has_negation = any(neg in words for neg in negation_words)
+            has_negation = not _NEGATION_WORDS.isdisjoint(words)
             
             # Check for intensifiers
-            intensifier_count = sum(1 for word in words if word in intensifiers)
+            intensifier_count = sum(1 for word in words if word in _INTENSIFIERS)
             intensifier_multiplier = 1.0 + (0.2 * intensifier_count)
             
+            term_counts = _count_keywords(sentence, _SENTIMENT_KEYWORD_SET)
+            
             # Process positive sentiment
-            for strength, terms in sentiment_lexicon["positive"].items():
-                # Assign weight based on strength
-                if strength == "strong":
-                    weight = 3.0
-                elif strength == "moderate":
-                    weight = 2.0
-                else:  # weak
-                    weight = 1.0
-                
+            for weight, terms in _POSITIVE_TERMS:
                 # Count occurrences
                 for term in terms:
-                    if term in sentence:
-                        count = sentence.count(term)
+                    count = term_counts.get(term)
+                    if count:
                         
                         # Apply negation (flips positive to negative)
                         if has_negation:
@@ -581,19 +680,11 @@ class DataProcessor:
                             positive_score += count * weight * intensifier_multiplier
             
             # Process negative sentiment
-            for strength, terms in sentiment_lexicon["negative"].items():
-                # Assign weight based on strength
-                if strength == "strong":
-                    weight = 3.0
-                elif strength == "moderate":
-                    weight = 2.0
-                else:  # weak
-                    weight = 1.0
-                
+            for weight, terms in _NEGATIVE_TERMS:
                 # Count occurrences
                 for term in terms:
-                    if term in sentence:
-                        count = sentence.count(term)
+                    count = term_counts.get(term)
+                    if count:
                         
                         # Apply negation (flips negative to positive)
                         if has_negation:
@@ -635,7 +726,7 @@ class DataProcessor:
             "category_type": "sentiment",
             "category_value": sentiment,
             "confidence_score": confidence,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
             "created_by": "system"
         }]
     
@@ -649,48 +740,73 @@ class DataProcessor:
         Returns:
             Dictionary mapping conversation IDs to lists of category objects
         """
-        # Extract user messages for analysis
-        conversation_texts = []
-        conversation_ids = []
+        # Extract user messages for analysis; each work item carries only the
+        # conversation fields the extractors read, not the embedded messages
+        items = []
         
         for conversation in conversations:
             user_messages = [msg for msg in conversation.get('messages', []) if msg.get('role') == 'user']
             user_content = " ".join([msg.get('content', '') for msg in user_messages])
+            context = {
+                field: conversation[field]
+                for field in CATEGORY_CONTEXT_FIELDS
+                if field in conversation
+            }
             
-            conversation_texts.append(user_content)
-            conversation_ids.append(conversation.get('_id'))
+            items.append((conversation.get('_id'), user_content, context))
         
-        # Process in parallel
         categories_by_conversation = {}
         
-        def process_conversation(idx):
-            conversation_id = conversation_ids[idx]
-            text = conversation_texts[idx]
-            conversation = next((c for c in conversations if c.get('_id') == conversation_id), {})
-            
-            # Extract categories
-            topic_categories = self._extract_topic_categories(text, conversation)
-            intent_categories = self._extract_intent_categories(text, conversation)
-            sentiment_categories = self._analyze_sentiment(text, conversation)
-            
-            # Combine categories
-            all_categories = topic_categories + intent_categories + sentiment_categories
-            
-            return conversation_id, all_categories
+        # Stamp the whole batch with one created_at timestamp
+        now_iso = datetime.now().isoformat()
         
-        # Process in parallel using thread pool
-        results = thread_pool_manager.map_processing(
-            process_conversation,
-            list(range(len(conversation_ids)))
+        # Process in parallel using the process pool; the extractors are CPU bound.
+        # The item function is static so the processor itself isn't pickled.
+        results = thread_pool_manager.map_process(
+            DataProcessor._extract_categories_item,
+            items,
+            now_iso
         )
         
-        # Convert results to dictionary
-        for conversation_id, categories in results:
+        # Convert results to dictionary, skipping conversations that failed
+        for result in results:
+            if result is None:
+                continue
+            
+            conversation_id, categories = result
             if conversation_id:
                 categories_by_conversation[conversation_id] = categories
         
         return categories_by_conversation
     
+    @staticmethod
+    def _extract_categories_item(
+        item: Tuple[str, str, Dict[str, Any]],
+        now_iso: Optional[str] = None
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Extract categories for one conversation from extract_categories_batch.
+        
+        Args:
+            item: Tuple of conversation ID, user message text and the conversation
+                fields the extractors read
+            now_iso: ISO timestamp for created_at
+            
+        Returns:
+            Tuple of (conversation_id, categories)
+        """
+        conversation_id, text, conversation = item
+        
+        # Extract categories
+        topic_categories = DataProcessor._extract_topic_categories(text, conversation, now_iso)
+        intent_categories = DataProcessor._extract_intent_categories(text, conversation, now_iso)
+        sentiment_categories = DataProcessor._analyze_sentiment(text, conversation, now_iso)
+        
+        # Combine categories
+        all_categories = topic_categories + intent_categories + sentiment_categories
+        
+        return conversation_id, all_categories
+    
     def update_user_analytics_batch(
         self,
         conversations: List[Dict[str, Any]],
@@ -721,12 +837,13 @@ class DataProcessor:
         
         # Process each user's conversations
         updated_user_analytics = []
+        now_iso = datetime.now().isoformat()
         
         for user_id, user_conversations in conversations_by_user.items():
             # Get existing user analytics
             user_analytics = existing_user_analytics.get(user_id, {
                 "_id": user_id,
-                "updated_at": datetime.now().isoformat(),
+                "updated_at": now_iso,
                 "total_conversations": 0,
                 "total_messages": 0,
                 "total_tokens": 0,
@@ -792,7 +909,7 @@ class DataProcessor:
                 user_analytics['model_usage'][model_id]['total_price'] += conversation.get('total_price', 0)
             
             # Update timestamp
-            user_analytics['updated_at'] = datetime.now().isoformat()
+            user_analytics['updated_at'] = now_iso
             
             updated_user_analytics.append(user_analytics)
         
@@ -800,142 +917,222 @@ class DataProcessor:
     
     def generate_analytics_reports(
         self,
-        conversations: List[Dict[str, Any]],
-        report_type: str = "daily"
-    ) -> List[Dict[str, Any]]:
+        conversations: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Generate analytics reports for a batch of conversations.
+        Generate daily, weekly and monthly analytics reports for a batch of conversations.
+        
+        Conversations are aggregated per day in a single pass; the daily
+        aggregates are then rolled up into weekly and monthly periods.
         
         Args:
             conversations: List of processed conversation documents
-            report_type: Type of report ("daily", "weekly", "monthly")
             
         Returns:
-            List of analytics report documents
+            Tuple of (daily_reports, weekly_reports, monthly_reports)
         """
         if not conversations:
-            return []
+            return [], [], []
         
-        # Group conversations by date
-        conversations_by_date = {}
+        # Aggregate conversations by date
+        metrics_by_date = {}
         
         for conversation in conversations:
             conv_created_at = conversation.get('created_at')
-            if not conv_created_at:
+            if not conv_created_at or not isinstance(conv_created_at, str):
                 continue
-                
-            # Extract date components
-            if isinstance(conv_created_at, str):
-                date_parts = conv_created_at.split('T')[0].split('-')
-                if len(date_parts) != 3:
-                    continue
-                    
-                year, month, day = date_parts
-                
-                if report_type == "daily":
-                    period_key = f"{year}-{month}-{day}"
-                    period_start = f"{year}-{month}-{day}T00:00:00Z"
-                    period_end = f"{year}-{month}-{day}T23:59:59Z"
-                elif report_type == "weekly":
-                    # This is a simplified weekly grouping by the day of the week
-                    # In a real implementation, you would use proper week calculations
-                    import datetime as dt
-                    date_obj = dt.date(int(year), int(month), int(day))
-                    week_start = date_obj - dt.timedelta(days=date_obj.weekday())
-                    week_end = week_start + dt.timedelta(days=6)
-                    period_key = f"{week_start.year}-W{week_start.isocalendar()[1]}"
-                    period_start = f"{week_start.isoformat()}T00:00:00Z"
-                    period_end = f"{week_end.isoformat()}T23:59:59Z"
-                elif report_type == "monthly":
-                    period_key = f"{year}-{month}"
-                    period_start = f"{year}-{month}-01T00:00:00Z"
-                    # Simplified month end calculation
-                    if month == "12":
-                        period_end = f"{int(year)+1}-01-01T00:00:00Z"
-                    else:
-                        next_month = int(month) + 1
-                        period_end = f"{year}-{next_month:02d}-01T00:00:00Z"
-                else:
-                    # Default to daily
-                    period_key = f"{year}-{month}-{day}"
-                    period_start = f"{year}-{month}-{day}T00:00:00Z"
-                    period_end = f"{year}-{month}-{day}T23:59:59Z"
-                
-                if period_key not in conversations_by_date:
-                    conversations_by_date[period_key] = {
-                        "conversations": [],
-                        "period_start": period_start,
-                        "period_end": period_end
-                    }
-                
-                conversations_by_date[period_key]["conversations"].append(conversation)
-        
-        # Generate reports for each period
-        reports = []
-        
-        for period_key, period_data in conversations_by_date.items():
-            period_conversations = period_data["conversations"]
             
-            # Skip periods with no conversations
-            if not period_conversations:
+            # Extract date components
+            date_parts = conv_created_at.split('T')[0].split('-')
+            if len(date_parts) != 3:
                 continue
             
-            # Calculate metrics
-            total_conversations = len(period_conversations)
-            total_messages = sum(conv.get('message_count', 0) for conv in period_conversations)
-            total_tokens = sum(conv.get('total_tokens', 0) for conv in period_conversations)
-            total_price = sum(conv.get('total_price', 0) for conv in period_conversations)
+            date_key = tuple(date_parts)
+            metrics = metrics_by_date.get(date_key)
+            if metrics is None:
+                metrics = metrics_by_date[date_key] = self._new_period_metrics()
+            
+            metrics["total_conversations"] += 1
+            metrics["total_messages"] += conversation.get('message_count', 0)
+            metrics["total_tokens"] += conversation.get('total_tokens', 0)
+            metrics["total_price"] += conversation.get('total_price', 0)
             
-            # Count unique users
-            unique_users = set(conv.get('from_end_user_id') for conv in period_conversations if conv.get('from_end_user_id'))
-            unique_user_count = len(unique_users)
+            user_id = conversation.get('from_end_user_id')
+            if user_id:
+                metrics["users"].add(user_id)
             
             # Count by model
-            model_counts = {}
-            for conv in period_conversations:
-                model_id = conv.get('model_id', 'unknown')
-                if model_id not in model_counts:
-                    model_counts[model_id] = {
-                        "conversation_count": 0,
-                        "message_count": 0,
-                        "total_tokens": 0,
-                        "total_price": 0
-                    }
-                
-                model_counts[model_id]["conversation_count"] += 1
-                model_counts[model_id]["message_count"] += conv.get('message_count', 0)
-                model_counts[model_id]["total_tokens"] += conv.get('total_tokens', 0)
-                model_counts[model_id]["total_price"] += conv.get('total_price', 0)
+            model_id = conversation.get('model_id', 'unknown')
+            if model_id not in metrics["model_counts"]:
+                metrics["model_counts"][model_id] = {
+                    "conversation_count": 0,
+                    "message_count": 0,
+                    "total_tokens": 0,
+                    "total_price": 0
+                }
+            
+            model_counts = metrics["model_counts"][model_id]
+            model_counts["conversation_count"] += 1
+            model_counts["message_count"] += conversation.get('message_count', 0)
+            model_counts["total_tokens"] += conversation.get('total_tokens', 0)
+            model_counts["total_price"] += conversation.get('total_price', 0)
             
             # Count by category
-            category_counts = {}
-            for conv in period_conversations:
-                for category in conv.get('categories', []):
-                    category_key = f"{category.get('category_type')}:{category.get('category_value')}"
-                    category_counts[category_key] = category_counts.get(category_key, 0) + 1
-            
-            # Create report document
-            report = {
-                "_id": f"{report_type}_{period_key}",
-                "report_type": report_type,
-                "period_key": period_key,
-                "period_start": period_data["period_start"],
-                "period_end": period_data["period_end"],
-                "created_at": datetime.now().isoformat(),
-                "report_data": {
-                    "total_conversations": total_conversations,
-                    "total_messages": total_messages,
-                    "total_tokens": total_tokens,
-                    "total_price": total_price,
-                    "unique_user_count": unique_user_count,
-                    "average_messages_per_conversation": total_messages / total_conversations if total_conversations > 0 else 0,
-                    "average_tokens_per_conversation": total_tokens / total_conversations if total_conversations > 0 else 0,
-                    "average_price_per_conversation": total_price / total_conversations if total_conversations > 0 else 0,
-                    "model_counts": model_counts,
-                    "category_counts": category_counts
-                }
-            }
+            category_counts = metrics["category_counts"]
+            for category in conversation.get('categories', []):
+                category_key = f"{category.get('category_type')}:{category.get('category_value')}"
+                category_counts[category_key] = category_counts.get(category_key, 0) + 1
+        
+        # Roll daily aggregates up into weekly and monthly periods
+        daily_periods = {}
+        weekly_periods = {}
+        monthly_periods = {}
+        
+        for (year, month, day), metrics in metrics_by_date.items():
+            daily_periods[f"{year}-{month}-{day}"] = (
+                f"{year}-{month}-{day}T00:00:00Z",
+                f"{year}-{month}-{day}T23:59:59Z",
+                metrics
+            )
             
-            reports.append(report)
+            date_obj = date(int(year), int(month), int(day))
+            week_start = date_obj - timedelta(days=date_obj.weekday())
+            week_end = week_start + timedelta(days=6)
+            self._merge_period_metrics(
+                weekly_periods,
+                f"{week_start.year}-W{week_start.isocalendar()[1]}",
+                f"{week_start.isoformat()}T00:00:00Z",
+                f"{week_end.isoformat()}T23:59:59Z",
+                metrics
+            )
+            
+            # Simplified month end calculation
+            if month == "12":
+                month_end = f"{int(year)+1}-01-01T00:00:00Z"
+            else:
+                month_end = f"{year}-{int(month) + 1:02d}-01T00:00:00Z"
+            self._merge_period_metrics(
+                monthly_periods,
+                f"{year}-{month}",
+                f"{year}-{month}-01T00:00:00Z",
+                month_end,
+                metrics
+            )
         
-        return reports
+        now = datetime.now().isoformat()
+        return tuple(
+            [
+                self._build_report(report_type, period_key, period_start, period_end, metrics, now)
+                for period_key, (period_start, period_end, metrics) in periods.items()
+            ]
+            for report_type, periods in (
+                ("daily", daily_periods),
+                ("weekly", weekly_periods),
+                ("monthly", monthly_periods)
+            )
+        )
+    
+    @staticmethod
+    def _new_period_metrics() -> Dict[str, Any]:
+        """
+        Create empty aggregates for a report period.
+        
+        Returns:
+            Dictionary of zeroed period metrics
+        """
+        return {
+            "total_conversations": 0,
+            "total_messages": 0,
+            "total_tokens": 0,
+            "total_price": 0,
+            "users": set(),
+            "model_counts": {},
+            "category_counts": {}
+        }
+    
+    def _merge_period_metrics(
+        self,
+        periods: Dict[str, Tuple[str, str, Dict[str, Any]]],
+        period_key: str,
+        period_start: str,
+        period_end: str,
+        metrics: Dict[str, Any]
+    ) -> None:
+        """
+        Add the aggregates of a shorter period into a longer one.
+        
+        Args:
+            periods: Dictionary mapping period keys to (start, end, metrics)
+            period_key: Key of the longer period
+            period_start: Start of the longer period
+            period_end: End of the longer period
+            metrics: Aggregates to add
+        """
+        if period_key not in periods:
+            periods[period_key] = (period_start, period_end, self._new_period_metrics())
+        
+        target = periods[period_key][2]
+        for field in ("total_conversations", "total_messages", "total_tokens", "total_price"):
+            target[field] += metrics[field]
+        
+        target["users"].update(metrics["users"])
+        
+        for model_id, counts in metrics["model_counts"].items():
+            if model_id not in target["model_counts"]:
+                target["model_counts"][model_id] = dict(counts)
+            else:
+                target_counts = target["model_counts"][model_id]
+                for field, value in counts.items():
+                    target_counts[field] += value
+        
+        for category_key, count in metrics["category_counts"].items():
+            target["category_counts"][category_key] = target["category_counts"].get(category_key, 0) + count
+    
+    @staticmethod
+    def _build_report(
+        report_type: str,
+        period_key: str,
+        period_start: str,
+        period_end: str,
+        metrics: Dict[str, Any],
+        created_at: str
+    ) -> Dict[str, Any]:
+        """
+        Build an analytics report document from period aggregates.
+        
+        Args:
+            report_type: Type of report ("daily", "weekly", "monthly")
+            period_key: Key of the period
+            period_start: Start of the period
+            period_end: End of the period
+            metrics: Aggregates of the period
+            created_at: Report creation timestamp
+            
+        Returns:
+            Analytics report document
+        """
+        total_conversations = metrics["total_conversations"]
+        total_messages = metrics["total_messages"]
+        total_tokens = metrics["total_tokens"]
+        total_price = metrics["total_price"]
+        
+        return {
+            "_id": f"{report_type}_{period_key}",
+            "report_type": report_type,
+            "period_key": period_key,
+            "period_start": period_start,
+            "period_end": period_end,
+            "created_at": created_at,
+            "report_data": {
+                "total_conversations": total_conversations,
+                "total_messages": total_messages,
+                "total_tokens": total_tokens,
+                "total_price": total_price,
+                "unique_user_count": len(metrics["users"]),
+                "average_messages_per_conversation": total_messages / total_conversations if total_conversations > 0 else 0,
+                "average_tokens_per_conversation": total_tokens / total_conversations if total_conversations > 0 else 0,
+                "average_price_per_conversation": total_price / total_conversations if total_conversations > 0 else 0,
+                "model_counts": metrics["model_counts"],
+                "category_counts": metrics["category_counts"]
+            }
+        }
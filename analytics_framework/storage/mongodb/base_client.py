@@ -3,10 +3,14 @@
 import logging
 from typing import Dict, List, Any, Optional, Union, Tuple
 
-from pymongo import MongoClient, UpdateOne, InsertOne, IndexModel
+from pymongo import MongoClient, UpdateOne, InsertOne, WriteConcern
 from pymongo.errors import BulkWriteError, PyMongoError, DuplicateKeyError
 from pymongo.collection import Collection
 
+# Acknowledged by the primary without waiting for the journal; for derived
+# data (user analytics, reports) that can be rebuilt from the source
+ANALYTICS_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
 
 class MongoDBBaseClient:
     """Base client for MongoDB operations with common functionality."""
@@ -48,18 +52,14 @@ class MongoDBBaseClient:
         
         Args:
             collection: MongoDB collection
-            indexes: List of index specifications
+            indexes: IndexModel objects to create
             collection_name: Name of the collection (for logging)
         """
         if not indexes:
             return
         
         try:
-            # Convert index specifications to IndexModel objects
-            index_models = [IndexModel(**index) for index in indexes]
-            
-            # Create indexes
-            result = collection.create_indexes(index_models)
+            result = collection.create_indexes(list(indexes))
             
             self.logger.info(
                 f"Created {len(result)} indexes for {collection_name} collection"
@@ -130,7 +130,8 @@ class MongoDBBaseClient:
         self, 
         collection: str, 
         documents: List[Dict[str, Any]], 
-        ordered: bool = False
+        ordered: bool = False,
+        write_concern: Optional[WriteConcern] = None
     ) -> List[str]:
         """
         Insert multiple documents into a collection.
@@ -139,6 +140,9 @@ class MongoDBBaseClient:
             collection: Collection name
             documents: List of documents to insert
             ordered: Whether to perform an ordered insert (stops on first error)
+            write_concern: Write concern overriding the database default. With
+                WriteConcern(w=0) the insert is not acknowledged, so write errors
+                such as duplicate keys are not reported.
             
         Returns:
             List of inserted document IDs
@@ -147,7 +151,10 @@ class MongoDBBaseClient:
             return []
             
         try:
-            result = self.db[collection].insert_many(documents, ordered=ordered)
+            coll = self.db[collection]
+            if write_concern is not None:
+                coll = coll.with_options(write_concern=write_concern)
+            result = coll.insert_many(documents, ordered=ordered)
             return [str(id) for id in result.inserted_ids]
         except BulkWriteError as bwe:
             # Handle partial success in bulk write operations
@@ -158,7 +165,7 @@ class MongoDBBaseClient:
             inserted_ids = []
             if hasattr(bwe, 'details') and 'writeErrors' in bwe.details:
                 # Calculate which documents were successfully inserted
-                error_indices = [err['index'] for err in bwe.details['writeErrors']]
+                error_indices = {err['index'] for err in bwe.details['writeErrors']}
                 for i, doc in enumerate(documents):
                     if i not in error_indices and '_id' in doc:
                         inserted_ids.append(str(doc['_id']))
@@ -178,7 +185,8 @@ class MongoDBBaseClient:
         collection: str,
         operations: List[Union[UpdateOne, InsertOne]],
         ordered: bool = False,
-        bypass_document_validation: bool = False
+        bypass_document_validation: bool = False,
+        write_concern: Optional[WriteConcern] = None
     ) -> Dict[str, Any]:
         """
         Perform a bulk write operation.
@@ -188,15 +196,22 @@ class MongoDBBaseClient:
             operations: List of write operations
             ordered: Whether to perform an ordered operation (stops on first error)
             bypass_document_validation: Whether to bypass document validation
+            write_concern: Write concern overriding the database default
             
         Returns:
-            Result of the bulk write operation
+            Result of the bulk write operation. On partial failure,
+            "failedOperations" maps the index of each failed operation
+            to its error message.
         """
         if not operations:
             return {"acknowledged": True, "nModified": 0, "nUpserted": 0, "nMatched": 0}
             
+        coll = self.db[collection]
+        if write_concern is not None:
+            coll = coll.with_options(write_concern=write_concern)
+        
         try:
-            result = self.db[collection].bulk_write(
+            result = coll.bulk_write(
                 operations, 
                 ordered=ordered,
                 bypass_document_validation=bypass_document_validation
@@ -220,12 +235,43 @@ class MongoDBBaseClient:
                 "nInserted": bwe.details.get("nInserted", 0),
                 "nRemoved": bwe.details.get("nRemoved", 0),
                 "writeErrors": len(bwe.details.get("writeErrors", [])),
+                "failedOperations": {
+                    err["index"]: err.get("errmsg", "")
+                    for err in bwe.details.get("writeErrors", [])
+                },
                 "error": str(bwe)
             }
         except PyMongoError as e:
             self.logger.error(f"Error performing bulk write on {collection}: {str(e)}")
             raise
     
+    def bulk_upsert(
+        self,
+        collection: str,
+        documents: List[Dict[str, Any]],
+        id_field: str = "_id",
+        write_concern: Optional[WriteConcern] = None
+    ) -> Dict[str, Any]:
+        """
+        Upsert many documents with a single unordered bulk write.
+        
+        Each document is merged into the stored one with $set, matching on id_field.
+        
+        Args:
+            collection: Collection name
+            documents: List of documents to upsert
+            id_field: Field identifying each document
+            write_concern: Write concern overriding the database default
+            
+        Returns:
+            Result of the bulk write operation
+        """
+        operations = [
+            UpdateOne({id_field: doc[id_field]}, {"$set": doc}, upsert=True)
+            for doc in documents
+        ]
+        return self.bulk_write(collection, operations, ordered=False, write_concern=write_concern)
+    
     def find_one(
         self,
         collection: str,
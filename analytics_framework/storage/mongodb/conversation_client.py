@@ -5,6 +5,8 @@ import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from pymongo import ReplaceOne
+
 from ..mongodb.base_client import MongoDBBaseClient
 from ...config import MONGODB_CONVERSATIONS_COLLECTION
 
@@ -58,6 +60,38 @@ class MongoDBConversationClient:
             self.logger.error(f"Error saving conversation: {str(e)}")
             raise
     
+    def bulk_save(self, conversations: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Save many conversations with a single unordered bulk write.
+        
+        Each conversation is upserted with the same replace semantics as
+        save_conversation; a failing document does not stop the others.
+        
+        Args:
+            conversations: List of conversation data
+            
+        Returns:
+            Dictionary mapping the ID of each conversation that failed to save
+            to its error message (empty if all were saved)
+        """
+        now = datetime.now().isoformat()
+        operations = []
+        for conversation_data in conversations:
+            if "_id" not in conversation_data:
+                conversation_data["_id"] = conversation_data.get("id", str(uuid.uuid4()))
+            conversation_data.setdefault("created_at", now)
+            conversation_data.setdefault("updated_at", now)
+            operations.append(
+                ReplaceOne({"_id": conversation_data["_id"]}, conversation_data, upsert=True)
+            )
+        
+        result = self.base_client.bulk_write(self.collection, operations, ordered=False)
+        
+        return {
+            conversations[index]["_id"]: message
+            for index, message in result.get("failedOperations", {}).items()
+        }
+    
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a conversation by ID.
@@ -5,7 +5,7 @@ import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union, Tuple
 
-from pymongo import MongoClient, UpdateOne, InsertOne, IndexModel
+from pymongo import MongoClient, UpdateOne, InsertOne
 from pymongo.errors import BulkWriteError, PyMongoError, DuplicateKeyError
 from pymongo.collection import Collection
 
@@ -111,18 +111,14 @@ class MongoDBClient:
         
         Args:
             collection: MongoDB collection
-            indexes: List of index specifications
+            indexes: IndexModel objects to create
             collection_name: Name of the collection (for logging)
         """
         if not indexes:
             return
         
         try:
-            # Convert index specifications to IndexModel objects
-            index_models = [IndexModel(**index) for index in indexes]
-            
-            # Create indexes
-            result = collection.create_indexes(index_models)
+            result = collection.create_indexes(list(indexes))
             
             self.logger.info(f"Created {len(result)} indexes for {collection_name} collection")
         except PyMongoError as e:
@@ -16,11 +16,13 @@ from ..config import (
     PARQUET_BASE_DIR,
     PARQUET_PARTITION_BY,
     PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
     PARQUET_ROW_GROUP_SIZE,
     PARQUET_PAGE_SIZE,
     PARQUET_TARGET_FILE_SIZE_MB,
     PARQUET_MAX_RECORDS_PER_FILE
 )
+from ..utils.thread_pool import thread_pool_manager
 
 
 class ParquetStorage:
@@ -34,6 +36,7 @@ class ParquetStorage:
         base_dir: str = PARQUET_BASE_DIR,
         partition_by: List[str] = PARQUET_PARTITION_BY,
         compression: str = PARQUET_COMPRESSION,
+        compression_level: Optional[int] = PARQUET_COMPRESSION_LEVEL,
         row_group_size: int = PARQUET_ROW_GROUP_SIZE,
         page_size: int = PARQUET_PAGE_SIZE,
         target_file_size_mb: int = PARQUET_TARGET_FILE_SIZE_MB,
@@ -49,6 +52,7 @@ class ParquetStorage:
             base_dir: Base directory for local storage
             partition_by: List of fields to partition by
             compression: Compression algorithm
+            compression_level: Compression level (ignored by codecs without levels)
             row_group_size: Number of rows per row group
             page_size: Page size in bytes
             target_file_size_mb: Target file size in MB
@@ -61,6 +65,7 @@ class ParquetStorage:
         self.base_dir = base_dir
         self.partition_by = partition_by
         self.compression = compression
+        self.compression_level = compression_level if compression in ("zstd", "gzip", "brotli") else None
         self.row_group_size = row_group_size
         self.page_size = page_size
         self.target_file_size_mb = target_file_size_mb
@@ -174,25 +179,34 @@ class ParquetStorage:
         
         return partition_values
     
-    def _records_to_dataframe(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+    def _records_to_table(self, records: List[Dict[str, Any]]) -> pa.Table:
         """
-        Convert records to a pandas DataFrame.
+        Convert records to a PyArrow Table.
+        
+        Columns are built directly with PyArrow rather than through a pandas
+        DataFrame. Missing fields become nulls and nested values are stored as
+        strings.
         
         Args:
             records: List of records
             
         Returns:
-            Pandas DataFrame
+            PyArrow Table
         """
-        # Convert to DataFrame
-        df = pd.DataFrame(records)
+        # Collect column names in first-seen order
+        keys = dict.fromkeys(key for record in records for key in record)
         
-        # Handle nested fields
-        for col in df.columns:
-            if df[col].apply(lambda x: isinstance(x, (dict, list))).any():
-                df[col] = df[col].apply(lambda x: str(x) if isinstance(x, (dict, list)) else x)
+        columns = {}
+        for key in keys:
+            values = [record.get(key) for record in records]
+            
+            # Handle nested fields
+            if any(isinstance(value, (dict, list)) for value in values):
+                values = [str(value) if isinstance(value, (dict, list)) else value for value in values]
+            
+            columns[key] = pa.array(values)
         
-        return df
+        return pa.Table.from_pydict(columns)
     
     def store_conversations(self, conversations: List[Dict[str, Any]]) -> List[str]:
         """
@@ -218,65 +232,88 @@ class ParquetStorage:
         
         for conversation in conversations:
             partition_values = self._extract_partition_values(conversation)
-            partition_key = str(partition_values)
+            partition_key = tuple(partition_values.items())
             
             if partition_key not in conversations_by_partition:
                 conversations_by_partition[partition_key] = []
             
             conversations_by_partition[partition_key].append(conversation)
         
-        # Store each partition
-        stored_paths = []
+        # Store partitions in parallel; PyArrow releases the GIL while encoding and writing
+        futures = [
+            thread_pool_manager.io_executor.submit(
+                self._store_conversation_partition,
+                dict(partition_key),
+                partition_conversations
+            )
+            for partition_key, partition_conversations in conversations_by_partition.items()
+        ]
+        
+        return [path for future in futures for path in future.result()]
+    
+    def _store_conversation_partition(
+        self,
+        partition_values: Dict[str, str],
+        partition_conversations: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Store the conversations of one partition with their messages and categories.
         
-        for partition_key, partition_conversations in conversations_by_partition.items():
-            partition_values = eval(partition_key)
-            
-            # Convert to DataFrame
-            df = self._records_to_dataframe(partition_conversations)
-            
-            # Get path
-            path = self._get_path("conversations", partition_values)
-            
-            # Get file prefix
-            file_prefix = self._get_path_prefix_for_file("conversations", partition_values)
-            
-            # Store DataFrame
-            self._store_dataframe(df, path, f"{file_prefix}conversations.parquet")
-            stored_paths.append(path)
-            
-            # Extract and store messages
-            messages = []
-            for conversation in partition_conversations:
-                conversation_id = conversation.get("_id")
-                conversation_messages = conversation.get("messages", [])
-                
-                for message in conversation_messages:
-                    message_copy = message.copy()
-                    message_copy["conversation_id"] = conversation_id
-                    messages.append(message_copy)
-            
-            if messages:
-                messages_df = self._records_to_dataframe(messages)
-                messages_path = os.path.join(path, "messages")
-                self._store_dataframe(messages_df, messages_path, f"{file_prefix}messages.parquet")
-                stored_paths.append(messages_path)
-            
-            # Extract and store categories
-            categories = []
-            for conversation in partition_conversations:
-                conversation_id = conversation.get("_id")
-                conversation_categories = conversation.get("categories", [])
-                
-                for category in conversation_categories:
-                    category_copy = category.copy()
-                    category_copy["conversation_id"] = conversation_id
-                    categories.append(category_copy)
+        Args:
+            partition_values: Dictionary of partition values
+            partition_conversations: Conversations belonging to the partition
             
-            if categories:
-                categories_df = self._records_to_dataframe(categories)
-                categories_path = os.path.join(path, "categories")
-                self._store_dataframe(categories_df, categories_path, f"{file_prefix}categories.parquet")
-                stored_paths.append(categories_path)
+        Returns:
+            List of paths where the data was stored
+        """
+        stored_paths = []
+        
+        # Convert to Arrow table
+        table = self._records_to_table(partition_conversations)
+        
+        # Get path
+        path = self._get_path("conversations", partition_values)
+        
+        # Get file prefix
+        file_prefix = self._get_path_prefix_for_file("conversations", partition_values)
+        
+        # Store table
+        self._store_table(table, path, f"{file_prefix}conversations.parquet")
+        stored_paths.append(path)
+        
+        # Extract and store messages
+        messages = []
+        for conversation in partition_conversations:
+            conversation_id = conversation.get("_id")
+            conversation_messages = conversation.get("messages", [])
+            
+            for message in conversation_messages:
+                message_copy = message.copy()
+                message_copy["conversation_id"] = conversation_id
+                messages.append(message_copy)
+        
+        if messages:
+            messages_table = self._records_to_table(messages)
+            messages_path = os.path.join(path, "messages")
+            self._store_table(messages_table, messages_path, f"{file_prefix}messages.parquet")
+            stored_paths.append(messages_path)
+        
+        # Extract and store categories
+        categories = []
+        for conversation in partition_conversations:
+            conversation_id = conversation.get("_id")
+            conversation_categories = conversation.get("categories", [])
+            
+            for category in conversation_categories:
+                category_copy = category.copy()
+                category_copy["conversation_id"] = conversation_id
+                categories.append(category_copy)
+        
+        if categories:
+            categories_table = self._records_to_table(categories)
+            categories_path = os.path.join(path, "categories")
+            self._store_table(categories_table, categories_path, f"{file_prefix}categories.parquet")
+            stored_paths.append(categories_path)
         
         return stored_paths
     
@@ -299,14 +336,14 @@ class ParquetStorage:
         
         self.logger.info(f"Storing {len(user_analytics)} user analytics records in Parquet format")
         
-        # Convert to DataFrame
-        df = self._records_to_dataframe(user_analytics)
+        # Convert to Arrow table
+        table = self._records_to_table(user_analytics)
         
         # Get path
         path = self._get_path("user_analytics")
         
-        # Store DataFrame
-        self._store_dataframe(df, path, "user_analytics.parquet")
+        # Store table
+        self._store_table(table, path, "user_analytics.parquet")
         
         return path
     
@@ -342,29 +379,35 @@ class ParquetStorage:
                 
             reports_by_type[report_type].append(report)
         
-        # Store each report type
+        # Store report types in parallel
         stored_paths = {}
+        futures = []
         
         for report_type, type_reports in reports_by_type.items():
-            # Convert to DataFrame
-            df = self._records_to_dataframe(type_reports)
+            # Convert to Arrow table
+            table = self._records_to_table(type_reports)
             
             # Get path
             path = self._get_path(f"analytics_reports/{report_type}")
             
-            # Store DataFrame
-            self._store_dataframe(df, path, f"{report_type}_reports.parquet")
+            # Store table
+            futures.append(thread_pool_manager.io_executor.submit(
+                self._store_table, table, path, f"{report_type}_reports.parquet"
+            ))
             stored_paths[report_type] = path
         
+        for future in futures:
+            future.result()
+        
         return stored_paths
     
-    def _store_dataframe(self, df: pd.DataFrame, path: str, filename: str) -> None:
+    def _store_table(self, table: pa.Table, path: str, filename: str) -> None:
         """
-        Store a DataFrame in Parquet format.
+        Store a PyArrow Table in Parquet format.
         
         Args:
-            df: DataFrame to store
-            path: Path to store the DataFrame
+            table: Table to store
+            path: Path to store the table
             filename: Filename for the Parquet file
         """
         # Create directory if it doesn't exist
@@ -374,9 +417,6 @@ class ParquetStorage:
         # Full path to the Parquet file
         full_path = os.path.join(path, filename)
         
-        # Convert to PyArrow Table
-        table = pa.Table.from_pandas(df)
-        
         # Write to Parquet
         try:
             if self.use_s3:
@@ -392,6 +432,7 @@ class ParquetStorage:
                     filesystem=self.fs,
                     basename_template=basename_template,
                     compression=self.compression,
+                    compression_level=self.compression_level,
                     row_group_size=self.row_group_size,
                     data_page_size=self.page_size,
                     use_dictionary=True,
@@ -403,15 +444,16 @@ class ParquetStorage:
                     table,
                     full_path,
                     compression=self.compression,
+                    compression_level=self.compression_level,
                     row_group_size=self.row_group_size,
                     data_page_size=self.page_size,
                     use_dictionary=True,
                     write_statistics=True
                 )
             
-            self.logger.info(f"Stored {len(df)} records in {full_path}")
+            self.logger.info(f"Stored {table.num_rows} records in {full_path}")
         except Exception as e:
-            self.logger.error(f"Error storing DataFrame in {full_path}: {str(e)}")
+            self.logger.error(f"Error storing table in {full_path}: {str(e)}")
             raise
     
     def read_conversations(
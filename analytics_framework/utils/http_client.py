@@ -6,7 +6,7 @@ from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from ..config import (
     ENABLE_MULTITHREADING,
@@ -15,6 +15,9 @@ from ..config import (
     RETRY_DELAY
 )
 
+# Transient statuses worth retrying; other 4xx responses fail immediately
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
 
 class HTTPClient:
     """HTTP client for making requests with retry and parallel capabilities."""
@@ -69,12 +72,19 @@ class HTTPClient:
         retry_strategy = Retry(
             total=self.max_retries,
             backoff_factor=self.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE", "PATCH"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
         )
         
-        # Mount the retry adapter to the session
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Mount the retry adapter to the session, with enough pooled
+        # keep-alive connections for every parallel worker
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers * 2,
+            max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -119,12 +129,14 @@ class HTTPClient:
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
-        retry_count: int = 0,
         **kwargs
     ) -> requests.Response:
         """
         Make an HTTP request.
         
+        Failed connections and 429/5xx responses are retried with exponential
+        backoff by the session's urllib3 Retry adapter.
+        
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             endpoint: API endpoint
@@ -133,7 +145,6 @@ class HTTPClient:
             json: Request body JSON
             headers: Request headers
             timeout: Request timeout in seconds
-            retry_count: Current retry count (used internally)
             **kwargs: Additional arguments for requests
             
         Returns:
@@ -156,10 +167,11 @@ class HTTPClient:
             )
             
             # Log request details
-            self.logger.debug(
-                f"{method} {url} - Status: {response.status_code} - "
-                f"Size: {len(response.content)} bytes"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"{method} {url} - Status: {response.status_code} - "
+                    f"Size: {len(response.content)} bytes"
+                )
             
             # Raise an exception for 4xx/5xx status codes
             response.raise_for_status()
@@ -167,34 +179,8 @@ class HTTPClient:
             return response
         
         except requests.exceptions.RequestException as e:
-            # Log the error
+            # Retries with backoff already happened in the session's adapter
             self.logger.error(f"Request error: {str(e)}")
-            
-            # Retry if we haven't exceeded max_retries
-            if retry_count < self.max_retries:
-                retry_count += 1
-                wait_time = self.retry_delay * (2 ** (retry_count - 1))  # Exponential backoff
-                
-                self.logger.info(
-                    f"Retrying {method} {url} in {wait_time} seconds "
-                    f"(attempt {retry_count}/{self.max_retries})"
-                )
-                
-                time.sleep(wait_time)
-                
-                return self.request(
-                    method=method,
-                    endpoint=endpoint,
-                    params=params,
-                    data=data,
-                    json=json,
-                    headers=headers,
-                    timeout=timeout,
-                    retry_count=retry_count,
-                    **kwargs
-                )
-            
-            # If we've exhausted retries, re-raise the exception
             raise
     
     def get(
@@ -371,7 +357,8 @@ class HTTPClient:
             process_response: Function to process each response (optional)
             
         Returns:
-            List of responses or processed results, with exceptions for failed requests
+            List of responses or processed results in the same order as
+            requests_data, with exceptions for failed requests
         """
         if not ENABLE_MULTITHREADING or len(requests_data) <= 1:
             # If multithreading is disabled or there's only one request, process sequentially
@@ -409,9 +396,9 @@ class HTTPClient:
                 )
                 futures.append(future)
             
-            # Collect results as they complete
+            # Collect results in submission order so callers can rely on positions
             results = []
-            for future in as_completed(futures):
+            for future in futures:
                 try:
                     response = future.result()
                     
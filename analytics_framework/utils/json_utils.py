@@ -0,0 +1,45 @@
+"""Fast JSON helpers backed by orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Uses orjson when available and falls back to the standard library.
+    Both accept bytes, so response bodies can be parsed without decoding.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to a UTF-8 encoded JSON document.
+
+    Uses orjson when available (which also handles datetime and UUID values)
+    and falls back to the standard library.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
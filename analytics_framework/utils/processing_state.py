@@ -67,20 +67,27 @@ class ProcessingState:
         except Exception as e:
             self.logger.error(f"Error saving state file: {str(e)}")
     
-    def update_last_processed(self, conversation_id: str, timestamp: Optional[str] = None) -> None:
+    def update_last_processed(
+        self,
+        conversation_id: str,
+        timestamp: Optional[str] = None,
+        count: int = 1
+    ) -> None:
         """
         Update the last processed conversation.
         
         Args:
             conversation_id: ID of the last processed conversation
             timestamp: Timestamp of the conversation (optional)
+            count: Number of conversations processed up to and including this one
         """
+        previous_count = self.state["processed_count"]
         self.state["last_processed_conversation_id"] = conversation_id
         self.state["last_processed_timestamp"] = timestamp or datetime.now().isoformat()
-        self.state["processed_count"] += 1
+        self.state["processed_count"] += count
         
-        # Auto-save every 10 updates
-        if self.state["processed_count"] % 10 == 0:
+        # Auto-save every 10 processed conversations
+        if self.state["processed_count"] // 10 != previous_count // 10:
             self.save()
     
     def start_run(self) -> None:
@@ -297,20 +304,27 @@ class S3ProcessingState:
         except Exception as e:
             self.logger.error(f"Error saving state to S3: {str(e)}")
     
-    def update_last_processed(self, conversation_id: str, timestamp: Optional[str] = None) -> None:
+    def update_last_processed(
+        self,
+        conversation_id: str,
+        timestamp: Optional[str] = None,
+        count: int = 1
+    ) -> None:
         """
         Update the last processed conversation.
         
         Args:
             conversation_id: ID of the last processed conversation
             timestamp: Timestamp of the conversation (optional)
+            count: Number of conversations processed up to and including this one
         """
+        previous_count = self.state["processed_count"]
         self.state["last_processed_conversation_id"] = conversation_id
         self.state["last_processed_timestamp"] = timestamp or datetime.now().isoformat()
-        self.state["processed_count"] += 1
+        self.state["processed_count"] += count
         
-        # Auto-save every 10 updates
-        if self.state["processed_count"] % 10 == 0:
+        # Auto-save every 10 processed conversations
+        if self.state["processed_count"] // 10 != previous_count // 10:
             self.save()
     
     def start_run(self) -> None:
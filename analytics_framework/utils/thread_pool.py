@@ -1,8 +1,11 @@
 """Thread pool manager for multi-threaded processing."""
 
 import logging
-from typing import Callable, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import threading
 from queue import Queue
 
@@ -11,10 +14,66 @@ from ..config import (
     MAX_WORKERS,
     CHUNK_SIZE,
     IO_THREADS,
-    PROCESSING_THREADS
+    PROCESSING_THREADS,
+    PROCESS_POOL_MIN_ITEMS
 )
 
 
+def _init_process_worker(log_queue: Any, level: int) -> None:
+    """
+    Route a process worker's logging to the parent process.
+
+    Runs once in each worker. Records go onto log_queue, where a listener in
+    the parent hands them to the parent's own logging setup.
+
+    Args:
+        log_queue: multiprocessing queue drained by the parent
+        level: Root log level of the parent
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+
+class _ForwardingHandler(logging.Handler):
+    """Hand records received from process workers to the parent's loggers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def _apply_in_process(
+    func: Callable,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    item: Any
+) -> Any:
+    """
+    Apply a function to one item inside a process worker.
+
+    Defined at module level so the process pool can pickle it.
+
+    Args:
+        func: Function to apply
+        args: Additional arguments for the function
+        kwargs: Additional keyword arguments for the function
+        item: Item to process
+
+    Returns:
+        Result of the function, or None if it raised
+    """
+    try:
+        return func(item, *args, **kwargs)
+    except Exception as e:
+        # The traceback reaches the parent through the worker's queue handler
+        logging.getLogger(__name__).exception(f"Error in process worker: {str(e)}")
+        return None
+
+
 class ThreadPoolManager:
     """Manager for thread pools and parallel processing."""
     
@@ -23,7 +82,12 @@ class ThreadPoolManager:
         self.logger = logging.getLogger(__name__)
         self.io_executor = ThreadPoolExecutor(max_workers=IO_THREADS)
         self.processing_executor = ThreadPoolExecutor(max_workers=PROCESSING_THREADS)
-        self.process_executor = ProcessPoolExecutor(max_workers=max(1, MAX_WORKERS // 2))
+        self.process_workers = max(1, MAX_WORKERS // 2)
+        
+        # The process pool is started on first use; see _get_process_executor
+        self.process_executor = None
+        self._process_log_listener = None
+        self._process_lock = threading.Lock()
         
         # Thread-local storage
         self.thread_local = threading.local()
@@ -34,9 +98,37 @@ class ThreadPoolManager:
         self.logger.info(
             f"Initialized thread pool manager with {IO_THREADS} IO threads, "
             f"{PROCESSING_THREADS} processing threads, and "
-            f"{max(1, MAX_WORKERS // 2)} process workers"
+            f"{self.process_workers} process workers"
         )
     
+    def _get_process_executor(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool, starting it on first use.
+        
+        Workers are spawned rather than forked: forking copies the parent's
+        logging queue, which nothing drains in the child, and locks held by
+        the parent's running threads. Each worker logs through a
+        multiprocessing queue that a listener here forwards to the parent's
+        loggers.
+        
+        Returns:
+            Process pool executor
+        """
+        with self._process_lock:
+            if self.process_executor is None:
+                context = multiprocessing.get_context("spawn")
+                log_queue = context.Queue()
+                self._process_log_listener = QueueListener(log_queue, _ForwardingHandler())
+                self._process_log_listener.start()
+                self.process_executor = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=context,
+                    initializer=_init_process_worker,
+                    initargs=(log_queue, logging.getLogger().getEffectiveLevel())
+                )
+            
+            return self.process_executor
+    
     def get_lock(self, resource_name: str) -> threading.Lock:
         """
         Get a lock for a specific resource.
@@ -63,7 +155,7 @@ class ThreadPoolManager:
             **kwargs: Additional keyword arguments for the function
             
         Returns:
-            List of results
+            List of results in the order of items (None for items that failed)
         """
         if not ENABLE_MULTITHREADING or len(items) <= 1:
             return [func(item, *args, **kwargs) for item in items]
@@ -73,8 +165,9 @@ class ThreadPoolManager:
             future = self.io_executor.submit(func, item, *args, **kwargs)
             futures.append(future)
         
+        # Collect in submission order so results line up with items
         results = []
-        for future in as_completed(futures):
+        for future in futures:
             try:
                 result = future.result()
                 results.append(result)
@@ -95,7 +188,7 @@ class ThreadPoolManager:
             **kwargs: Additional keyword arguments for the function
             
         Returns:
-            List of results
+            List of results in the order of items (None for items that failed)
         """
         if not ENABLE_MULTITHREADING or len(items) <= 1:
             return [func(item, *args, **kwargs) for item in items]
@@ -105,8 +198,9 @@ class ThreadPoolManager:
             future = self.processing_executor.submit(func, item, *args, **kwargs)
             futures.append(future)
         
+        # Collect in submission order so results line up with items
         results = []
-        for future in as_completed(futures):
+        for future in futures:
             try:
                 result = future.result()
                 results.append(result)
@@ -120,6 +214,11 @@ class ThreadPoolManager:
         """
         Map a function over items using the process pool.
         
+        Meant for CPU-bound pure-Python work that serializes on the GIL in
+        the processing threads. The function and its arguments must be
+        picklable. Batches smaller than PROCESS_POOL_MIN_ITEMS go to the
+        processing threads, where pickling overhead would dominate.
+        
         Args:
             func: Function to apply
             items: Items to process
@@ -127,32 +226,26 @@ class ThreadPoolManager:
             **kwargs: Additional keyword arguments for the function
             
         Returns:
-            List of results
+            List of results in the order of items (None for items that failed)
         """
         if not ENABLE_MULTITHREADING or len(items) <= 1:
             return [func(item, *args, **kwargs) for item in items]
         
-        # Split items into chunks for better performance
-        chunks = [items[i:i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE)]
-        
-        # Define a wrapper function that processes a chunk
-        def process_chunk(chunk):
-            return [func(item, *args, **kwargs) for item in chunk]
-        
-        futures = []
-        for chunk in chunks:
-            future = self.process_executor.submit(process_chunk, chunk)
-            futures.append(future)
-        
-        results = []
-        for future in as_completed(futures):
-            try:
-                chunk_results = future.result()
-                results.extend(chunk_results)
-            except Exception as e:
-                self.logger.error(f"Error in process worker: {str(e)}")
-        
-        return results
+        if len(items) < PROCESS_POOL_MIN_ITEMS:
+            return self.map_processing(func, items, *args, **kwargs)
+        
+        # Send items in chunks so each worker round trip amortizes IPC
+        chunksize = min(CHUNK_SIZE, max(1, len(items) // (4 * self.process_workers)))
+        
+        try:
+            return list(self._get_process_executor().map(
+                partial(_apply_in_process, func, args, kwargs),
+                items,
+                chunksize=chunksize
+            ))
+        except Exception as e:
+            self.logger.error(f"Error in process pool, falling back to threads: {str(e)}")
+            return self.map_processing(func, items, *args, **kwargs)
     
     def parallel_for_each(
         self,
@@ -186,7 +279,9 @@ class ThreadPoolManager:
         """Shutdown all thread pools."""
         self.io_executor.shutdown(wait=True)
         self.processing_executor.shutdown(wait=True)
-        self.process_executor.shutdown(wait=True)
+        if self.process_executor is not None:
+            self.process_executor.shutdown(wait=True)
+            self._process_log_listener.stop()
         self.logger.info("Thread pool manager shutdown complete")
 
 
@@ -32,7 +32,7 @@ def create_collection_indexes(client, collection_name, indexes):
     Args:
         client: MongoDB client
         collection_name: Name of the collection
-        indexes: List of index definitions
+        indexes: IndexModel objects to create
         
     Returns:
         int: Number of indexes created successfully
@@ -41,15 +41,13 @@ def create_collection_indexes(client, collection_name, indexes):
     success_count = 0
     
     for index in indexes:
+        keys = list(index.document["key"].items())
         try:
-            client.base_client.create_index(
-                collection_name,
-                list(index["key"].items())
-            )
-            logger.info(f"Created index: {index['key']}")
+            client.base_client.create_index(collection_name, keys)
+            logger.info(f"Created index: {keys}")
             success_count += 1
         except Exception as e:
-            logger.error(f"Error creating index {index['key']}: {str(e)}")
+            logger.error(f"Error creating index {keys}: {str(e)}")
     
     return success_count
 